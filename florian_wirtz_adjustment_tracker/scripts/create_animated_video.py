@@ -4,13 +4,33 @@ Creates mobile-optimized animated video for social media platforms
 """
 
 import pandas as pd
+import matplotlib
+matplotlib.use('Agg')  # Render off-screen; no GUI event loop per draw
 import matplotlib.pyplot as plt
-import matplotlib.animation as animation
 from matplotlib.patches import Rectangle
 import numpy as np
+import argparse
+import multiprocessing
+import shutil
+import subprocess
+import tempfile
 import os
 
+# Label box styles shared by every annotation
+BASELINE_BBOX = dict(boxstyle='round,pad=0.3', facecolor='black', alpha=0.7)
+MATCH_BBOX = dict(boxstyle='round,pad=0.3', facecolor='darkred', alpha=0.7)
+OVERLAY_BBOX = dict(boxstyle='round,pad=0.8', facecolor='#1a1a1a', alpha=0.8)
+
 class WirtzAnimationCreator:
+    baseline_colors = ['#00FF7F', '#32CD32']  # Bright greens for Leverkusen
+
+    # Render/encode settings: 'draft' trades fidelity for fast iteration runs.
+    # 10.8in x 75dpi = 810px keeps the frame size even, as libx264 requires.
+    quality_presets = {
+        'final': {'dpi': 100, 'bitrate': 8000, 'extra_args': []},
+        'draft': {'dpi': 75, 'bitrate': -1, 'extra_args': ['-preset', 'ultrafast', '-crf', '28']},
+    }
+
     def __init__(self, data_path, output_dir):
         self.data_path = data_path
         self.output_dir = output_dir
@@ -28,25 +48,55 @@ class WirtzAnimationCreator:
         self.match_duration = 1  # 1 second per match
         self.finale_duration = 3
 
-    def load_and_prepare_data(self):
+    def load_and_prepare_data(self, verbose=True):
         """Load and organize the performance data"""
-        self.df = pd.read_csv(self.data_path)
+        self.df = pd.read_csv(self.data_path, dtype={'opponent': 'category'})
 
-        # Separate baseline and match data
-        self.baseline_data = self.df[self.df['opponent'].isin(['2023-2024', '2024-2025'])].copy()
-        self.match_data = self.df[~self.df['opponent'].isin(['2023-2024', '2024-2025'])].copy()
+        # Separate baseline and match data with a single membership scan
+        is_baseline = self.df['opponent'].isin({'2023-2024', '2024-2025'})
+        self.baseline_data = self.df.loc[is_baseline].copy()
+        self.match_data = self.df.loc[~is_baseline].copy()
 
         # Sort baseline data chronologically
         self.baseline_data = self.baseline_data.sort_values('opponent')
 
-        print(f"Baseline data: {len(self.baseline_data)} seasons")
-        print("Baseline data:")
-        print(self.baseline_data)
-        print(f"Match data: {len(self.match_data)} matches")
-        print("Match data:")
-        print(self.match_data)
+        # Cache point coordinates as (n, 2) arrays of (CII, GTI)
+        self.baseline_xy = self.baseline_data[['CII', 'GTI']].to_numpy()
+        self.match_xy = self.match_data[['CII', 'GTI']].to_numpy()
+        self.baseline_names = self.baseline_data['opponent'].to_numpy()
+        self.match_names = self.match_data['opponent'].to_numpy()
+
+        # Axis limits with y-axis range being 130% of x-axis range
+        all_xy = np.concatenate([self.baseline_xy, self.match_xy])
+        x_min, x_max = all_xy[:, 0].min() * 0.9, all_xy[:, 0].max() * 1.1
+        x_range = x_max - x_min
+        y_center = (all_xy[:, 1].min() + all_xy[:, 1].max()) / 2
+        y_range = x_range * 1.3
+        self.xlim = (x_min, x_max)
+        self.ylim = (y_center - y_range / 2, y_center + y_range / 2)
+
+        # Per-point timing used by the vectorized frame math
+        self.baseline_delay = 0.1 + np.arange(len(self.baseline_xy)) * 0.2  # Progress at which each point appears
+        self.match_index = np.arange(len(self.match_xy))
+
+        # Liverpool colour ramp, one RGBA row per match
+        self.liverpool_colors = plt.cm.Reds(np.linspace(0.5, 1, len(self.match_xy)))
 
-    def setup_mobile_plot(self):
+        # Calculate total duration and frames
+        self.total_duration = (self.intro_duration + self.baseline_duration +
+                               len(self.match_xy) * self.match_duration + self.finale_duration)
+        self.total_frames = int(self.total_duration * 30)  # 30 fps
+        self.build_frame_tables()
+
+        if verbose:
+            print(f"Baseline data: {len(self.baseline_data)} seasons")
+            print("Baseline data:")
+            print(self.baseline_data)
+            print(f"Match data: {len(self.match_data)} matches")
+            print("Match data:")
+            print(self.match_data)
+
+    def setup_mobile_plot(self, verbose=True):
         """Setup the plot with square dimensions and styling"""
         plt.style.use('dark_background')
 
@@ -61,22 +111,16 @@ class WirtzAnimationCreator:
         # Adjust layout
         plt.subplots_adjust(top=0.95, bottom=0.1)
 
-        # Set axis limits with y-axis being 130% of x-axis range
-        all_data = pd.concat([self.baseline_data, self.match_data])
-        x_min, x_max = all_data['CII'].min() * 0.9, all_data['CII'].max() * 1.1
-        x_range = x_max - x_min
-
-        # Calculate y-axis range to be 130% of x-axis range
-        y_center = (all_data['GTI'].min() + all_data['GTI'].max()) / 2
-        y_range = x_range * 1.3
-        y_min = y_center - y_range / 2
-        y_max = y_center + y_range / 2
-
+        # Set axis limits computed in load_and_prepare_data
+        x_min, x_max = self.xlim
+        y_min, y_max = self.ylim
         self.ax.set_xlim(x_min, x_max)
         self.ax.set_ylim(y_min, y_max)
+        self.ax.set_autoscale_on(False)  # Limits are fixed; skip autoscaling as artists change
 
-        print(f"Plot setup - X limits: ({x_min:.3f}, {x_max:.3f}), Y limits: ({y_min:.3f}, {y_max:.3f})")
-        print(f"X range: {x_range:.3f}, Y range: {y_range:.3f} (130% of X)")
+        if verbose:
+            print(f"Plot setup - X limits: ({x_min:.3f}, {x_max:.3f}), Y limits: ({y_min:.3f}, {y_max:.3f})")
+            print(f"X range: {x_max - x_min:.3f}, Y range: {y_max - y_min:.3f} (130% of X)")
 
         # Mobile-optimized styling
         self.ax.grid(True, alpha=0.2, linestyle='-', linewidth=0.5, color='#404040')
@@ -95,214 +139,294 @@ class WirtzAnimationCreator:
         self.ax.set_ylabel('Goal Threat Index (GTI)',
                           fontsize=20, fontweight='bold', color='#FFFFFF', labelpad=20)
 
+        self.create_artists()
+
     def create_text_overlay(self, text, y_position=0.05, fontsize=24):
         """Create text overlay below the x-axis"""
         return self.fig.text(0.5, y_position, text,
                            fontsize=fontsize, fontweight='bold',
                            color='#FFFFFF', ha='center', va='center',
-                           bbox=dict(boxstyle='round,pad=0.8',
-                                   facecolor='#1a1a1a', alpha=0.8))
-
-    def animate_frame(self, frame):
-        """Animation function for each frame"""
-        self.ax.clear()
-
-        # Re-setup basic plot styling (without full setup)
-        self.ax.set_facecolor('#0E1117')
-
-        # Set axis limits with y-axis being 130% of x-axis range
-        all_data = pd.concat([self.baseline_data, self.match_data])
-        x_min, x_max = all_data['CII'].min() * 0.9, all_data['CII'].max() * 1.1
-        x_range = x_max - x_min
-
-        # Calculate y-axis range to be 130% of x-axis range
-        y_center = (all_data['GTI'].min() + all_data['GTI'].max()) / 2
-        y_range = x_range * 1.3
-        y_min = y_center - y_range / 2
-        y_max = y_center + y_range / 2
-
-        self.ax.set_xlim(x_min, x_max)
-        self.ax.set_ylim(y_min, y_max)
-
-        # Style the axes
-        self.ax.grid(True, alpha=0.2, linestyle='-', linewidth=0.5, color='#404040')
-        self.ax.set_axisbelow(True)
-        self.ax.spines['bottom'].set_color('#404040')
-        self.ax.spines['left'].set_color('#404040')
-        self.ax.spines['top'].set_visible(False)
-        self.ax.spines['right'].set_visible(False)
-        self.ax.tick_params(colors='#CCCCCC', which='both', labelsize=16)
+                           bbox=OVERLAY_BBOX)
+
+    def create_artists(self):
+        """Create every animated artist once; frames only mutate their state"""
+        n_base = len(self.baseline_xy)
+        n_match = len(self.match_xy)
+
+        # Baseline points (hidden until their bounce-in starts)
+        self.baseline_scatter = self.ax.scatter(self.baseline_xy[:, 0], self.baseline_xy[:, 1],
+                                                c=self.baseline_colors[:n_base], s=np.zeros(n_base), alpha=0.9,
+                                                edgecolors='white', linewidth=np.zeros(n_base), zorder=3)
+        self.baseline_line, = self.ax.plot(self.baseline_xy[:, 0], self.baseline_xy[:, 1],
+                                           'g--', linewidth=2, alpha=0.7, visible=False)
+
+        # Liverpool matches
+        self.match_scatter = self.ax.scatter(self.match_xy[:, 0], self.match_xy[:, 1],
+                                             c=self.liverpool_colors, s=np.zeros(n_match), alpha=0.9,
+                                             edgecolors='white', linewidth=np.zeros(n_match), zorder=3)
+        self.match_line, = self.ax.plot([], [], 'r-', linewidth=3, alpha=0.8)
+
+        # Finale glow around the final match
+        final_x, final_y = self.match_xy[-1]
+        self.glow_scatter = self.ax.scatter(final_x, final_y,
+                                            c='red', s=400, alpha=0.3, zorder=1, visible=False)
+        self.final_scatter = self.ax.scatter(final_x, final_y,
+                                             c='red', s=250, alpha=0.9,
+                                             edgecolors='white', linewidth=3, zorder=4, visible=False)
 
         # Labels
-        self.ax.set_xlabel('Creative Impact Index (CII)',
-                          fontsize=20, fontweight='bold', color='#FFFFFF', labelpad=20)
-        self.ax.set_ylabel('Goal Threat Index (GTI)',
-                          fontsize=20, fontweight='bold', color='#FFFFFF', labelpad=20)
+        self.baseline_annotations = []
+        for name, xy in zip(self.baseline_names, self.baseline_xy):
+            self.baseline_annotations.append(
+                self.ax.annotate(name, xy,
+                                 xytext=(10, 10), textcoords='offset points',
+                                 fontsize=16, fontweight='bold', color='white',
+                                 bbox=BASELINE_BBOX,
+                                 visible=False))
+
+        self.match_annotations = []
+        for name, xy in zip(self.match_names, self.match_xy):
+            self.match_annotations.append(
+                self.ax.annotate(name, xy,
+                                 xytext=(10, 10), textcoords='offset points',
+                                 fontsize=16, fontweight='bold', color='white',
+                                 bbox=MATCH_BBOX,
+                                 visible=False))
+
+        # Blitting draws in list order, so sort by zorder like a full redraw does
+        # (stable, so equal zorders keep their creation order)
+        self.animated_artists = sorted([self.baseline_scatter, self.baseline_line,
+                                        self.match_scatter, self.match_line,
+                                        self.glow_scatter, self.final_scatter]
+                                       + self.baseline_annotations + self.match_annotations,
+                                       key=lambda artist: artist.get_zorder())
+
+    @staticmethod
+    def toggle_annotations(annotations, visible_mask):
+        """Show/hide cached annotations, touching only those whose state changes"""
+        for annotation, visible in zip(annotations, visible_mask):
+            if annotation.get_visible() != visible:
+                annotation.set_visible(bool(visible))
+
+    def build_frame_tables(self):
+        """Precompute point sizes and visibility for every frame as lookup tables"""
+        n_match = len(self.match_xy)
+
+        current_time = np.arange(self.total_frames) / 30  # Convert frame to seconds (30 fps)
 
-        # Remove existing text overlays
-        for text in self.fig.texts:
-            text.remove()
-
-        total_frames = (self.intro_duration + self.baseline_duration +
-                       len(self.match_data) * self.match_duration + self.finale_duration) * 30
+        # Since intro_duration = 0, start directly with baseline section
+        # Section 1: Baseline Data (0-9 seconds), one row per frame
+        in_baseline = (current_time <= self.baseline_duration)[:, None]
+        progress = (current_time / self.baseline_duration)[:, None]
+
+        # Baseline points bounce in, staggered by baseline_delay, then stay at full size
+        baseline_visible = ~in_baseline | (progress > self.baseline_delay)
+        bounce_scale = 1 + 0.3 * np.sin((progress - self.baseline_delay) * 25)
+        bounce_sizes = np.where(progress < self.baseline_delay + 0.3, 200 * bounce_scale, 200)
+        baseline_sizes = np.where(in_baseline, bounce_sizes, 200) * baseline_visible
+
+        # Connect baseline points
+        show_baseline_line = ~in_baseline[:, 0] | (progress[:, 0] > 0.6)  # Earlier connection
+
+        # Section 2: Liverpool matches appear one by one, pulsing the match being added
+        match_start_time = self.baseline_duration  # Starts at 9 seconds
+        match_time = current_time - match_start_time
+        matches_to_show = np.floor(match_time / self.match_duration).astype(int)[:, None]
+        match_visible = ~in_baseline & (self.match_index < matches_to_show)
+        pulse_time = (match_time % self.match_duration) / self.match_duration
+        pulse_scale = (1 + 0.5 * np.sin(pulse_time * 10))[:, None]
+        match_sizes = np.where(self.match_index == matches_to_show - 1, 250 * pulse_scale, 200) * match_visible
+
+        # Section 4: Finale (pulse the final match)
+        finale_start = (match_start_time + n_match * self.match_duration)
+        finale_time = current_time - finale_start
+        show_glow = (current_time > finale_start) & (finale_time <= self.finale_duration)
+
+        self.frame_tables = {
+            'baseline_sizes': baseline_sizes.astype(np.float32),
+            'baseline_visible': baseline_visible,
+            'show_baseline_line': show_baseline_line,
+            'match_sizes': match_sizes.astype(np.float32),
+            'match_visible': match_visible,
+            'glow_pulse': np.where(show_glow, 1 + 0.3 * np.sin(finale_time * 8), np.nan).astype(np.float32),
+        }
+
+    def compute_frame_state(self, frame):
+        """Look up point sizes and visibility for a frame without touching any artist"""
+        tables = self.frame_tables
+        glow_pulse = tables['glow_pulse'][frame]
+        return (tables['baseline_sizes'][frame], tables['baseline_visible'][frame],
+                bool(tables['show_baseline_line'][frame]),
+                tables['match_sizes'][frame], tables['match_visible'][frame],
+                None if np.isnan(glow_pulse) else float(glow_pulse))
 
-        current_time = frame / 30  # Convert frame to seconds (30 fps)
+    def animate_frame(self, frame):
+        """Animation function for each frame"""
+        (baseline_sizes, baseline_visible, show_baseline_line,
+         match_sizes, match_visible, glow_pulse) = self.compute_frame_state(frame)
 
         # Debug print
         if frame % 60 == 0:  # Print every 2 seconds
+            current_time = frame / 30
             print(f"Frame {frame}, Time: {current_time:.1f}s")
-
-        # Since intro_duration = 0, start directly with baseline section
-        # Section 1: Baseline Data (0-9 seconds)
-        if current_time <= self.baseline_duration:
-            section_time = current_time
-            progress = section_time / self.baseline_duration
-
-            if frame % 60 == 0:
-                print(f"  Section 1: Baseline, progress={progress:.2f}")
-
-            # Show baseline points with bounce effect
-            if progress > 0.1:  # Start earlier since we have less time
-                colors = ['#00FF7F', '#32CD32']  # Bright greens for Leverkusen
-
-                for i, (_, row) in enumerate(self.baseline_data.iterrows()):
-                    if progress > 0.1 + i * 0.2:  # Faster appearance
-                        # Bounce effect
-                        bounce_scale = 1 + 0.3 * np.sin((progress - 0.1 - i * 0.2) * 25)
-                        size = 200 * bounce_scale if progress < 0.4 + i * 0.2 else 200
-
-                        self.ax.scatter(row['CII'], row['GTI'],
-                                      c=colors[i], s=size, alpha=0.9,
-                                      edgecolors='white', linewidth=2, zorder=3)
-
-                        # Add labels
-                        self.ax.annotate(row['opponent'],
-                                       (row['CII'], row['GTI']),
-                                       xytext=(10, 10), textcoords='offset points',
-                                       fontsize=16, fontweight='bold', color='white',
-                                       bbox=dict(boxstyle='round,pad=0.3',
-                                               facecolor='black', alpha=0.7))
-
-                        if frame % 60 == 0:
-                            print(f"    Showing baseline point {i}: {row['opponent']} at ({row['CII']:.2f}, {row['GTI']:.2f})")
-
-                # Connect baseline points
-                if progress > 0.6:  # Earlier connection
-                    baseline_x = self.baseline_data['CII'].values
-                    baseline_y = self.baseline_data['GTI'].values
-                    self.ax.plot(baseline_x, baseline_y, 'g--', linewidth=2, alpha=0.7)
-
-        # Section 2: Liverpool Performance (9+ seconds)
+            if current_time <= self.baseline_duration:
+                print(f"  Section 1: Baseline, progress={current_time / self.baseline_duration:.2f}")
+                for i in np.flatnonzero(baseline_visible):
+                    cii, gti = self.baseline_xy[i]
+                    print(f"    Showing baseline point {i}: {self.baseline_names[i]} at ({cii:.2f}, {gti:.2f})")
+
+        # Zero-size points still stroke their edge, so hide edges as well
+        self.baseline_scatter.set_sizes(baseline_sizes)
+        self.baseline_scatter.set_linewidths(np.where(baseline_visible, 2, 0))
+        self.baseline_line.set_visible(show_baseline_line)
+        self.toggle_annotations(self.baseline_annotations, baseline_visible)
+
+        self.match_scatter.set_sizes(match_sizes)
+        self.match_scatter.set_linewidths(np.where(match_visible, 2, 0))
+        self.toggle_annotations(self.match_annotations, match_visible)
+
+        # Connect Liverpool matches with trajectory line
+        shown = int(match_visible.sum())
+        if shown > 1:
+            self.match_line.set_data(self.match_xy[:shown, 0], self.match_xy[:shown, 1])
         else:
-            # Show baseline points (always visible)
-            colors = ['#00FF7F', '#32CD32']
-            for i, (_, row) in enumerate(self.baseline_data.iterrows()):
-                self.ax.scatter(row['CII'], row['GTI'],
-                              c=colors[i], s=200, alpha=0.9,
-                              edgecolors='white', linewidth=2, zorder=3)
-                self.ax.annotate(row['opponent'],
-                               (row['CII'], row['GTI']),
-                               xytext=(10, 10), textcoords='offset points',
-                               fontsize=16, fontweight='bold', color='white',
-                               bbox=dict(boxstyle='round,pad=0.3',
-                                       facecolor='black', alpha=0.7))
-
-            # Connect baseline points
-            baseline_x = self.baseline_data['CII'].values
-            baseline_y = self.baseline_data['GTI'].values
-            self.ax.plot(baseline_x, baseline_y, 'g--', linewidth=2, alpha=0.7)
-
-            # Liverpool matches
-            match_start_time = self.baseline_duration  # Starts at 9 seconds
-            match_time = current_time - match_start_time
-            matches_to_show = int(match_time / self.match_duration)
-
-            if matches_to_show > 0:
-                # Show Liverpool matches progressively
-                liverpool_colors = plt.cm.Reds(np.linspace(0.5, 1, len(self.match_data)))
-
-                match_x = []
-                match_y = []
-
-                for i in range(min(matches_to_show, len(self.match_data))):
-                    row = self.match_data.iloc[i]
-
-                    # Special effect for the current match being added
-                    if i == matches_to_show - 1:
-                        pulse_time = (match_time % self.match_duration) / self.match_duration
-                        pulse_scale = 1 + 0.5 * np.sin(pulse_time * 10)
-                        size = 250 * pulse_scale
-                    else:
-                        size = 200
-
-                    self.ax.scatter(row['CII'], row['GTI'],
-                                  c=[liverpool_colors[i]], s=size, alpha=0.9,
-                                  edgecolors='white', linewidth=2, zorder=3)
-
-                    self.ax.annotate(row['opponent'],
-                                   (row['CII'], row['GTI']),
-                                   xytext=(10, 10), textcoords='offset points',
-                                   fontsize=16, fontweight='bold', color='white',
-                                   bbox=dict(boxstyle='round,pad=0.3',
-                                           facecolor='darkred', alpha=0.7))
-
-                    match_x.append(row['CII'])
-                    match_y.append(row['GTI'])
-
-                # Connect Liverpool matches with trajectory line
-                if len(match_x) > 1:
-                    self.ax.plot(match_x, match_y, 'r-', linewidth=3, alpha=0.8)
-
-            # Section 4: Finale (highlight final match)
-            finale_start = (match_start_time + len(self.match_data) * self.match_duration)
-            if current_time > finale_start:
-                finale_time = current_time - finale_start
-                if finale_time <= self.finale_duration:
-                    # Pulse the final point
-                    final_match = self.match_data.iloc[-1]
-                    pulse = 1 + 0.3 * np.sin(finale_time * 8)
-
-                    # Add glow effect
-                    self.ax.scatter(final_match['CII'], final_match['GTI'],
-                                  c='red', s=400 * pulse, alpha=0.3, zorder=1)
-                    self.ax.scatter(final_match['CII'], final_match['GTI'],
-                                  c='red', s=250 * pulse, alpha=0.9,
-                                  edgecolors='white', linewidth=3, zorder=4)
-
-    def create_animation(self):
-        """Create the full animation"""
+            self.match_line.set_data([], [])
+
+        # Add glow effect
+        self.glow_scatter.set_visible(glow_pulse is not None)
+        self.final_scatter.set_visible(glow_pulse is not None)
+        if glow_pulse is not None:
+            self.glow_scatter.set_sizes([400 * glow_pulse])
+            self.final_scatter.set_sizes([250 * glow_pulse])
+
+        return self.animated_artists
+
+    def cache_background(self):
+        """Draw the static axes, grid and labels once and keep the pixels for blitting"""
+        for artist in self.animated_artists:
+            artist.set_animated(True)
+        self.fig.canvas.draw()
+        self.background = self.fig.canvas.copy_from_bbox(self.fig.bbox)
+
+    def render_frame_rgba(self, frame):
+        """Blit one frame over the cached background and return its raw RGBA bytes"""
+        self.animate_frame(frame)
+
+        canvas = self.fig.canvas
+        canvas.restore_region(self.background)
+        for artist in self.animated_artists:
+            self.fig.draw_artist(artist)
+        return bytes(canvas.buffer_rgba())
+
+    def open_ffmpeg_pipe(self, output_path, dpi=100, fps=30, bitrate=8000, extra_args=()):
+        """Start an ffmpeg process that encodes raw RGBA frames written to its stdin"""
+        width = int(round(self.fig.get_figwidth() * dpi))
+        height = int(round(self.fig.get_figheight() * dpi))
+
+        ffmpeg_cmd = [matplotlib.rcParams['animation.ffmpeg_path'], '-y',
+                      '-f', 'rawvideo', '-pix_fmt', 'rgba', '-s', f'{width}x{height}', '-r', str(fps),
+                      '-i', '-',
+                      '-c:v', 'libx264', '-pix_fmt', 'yuv420p']
+        if bitrate > 0:
+            ffmpeg_cmd += ['-b:v', f'{bitrate}k']
+        ffmpeg_cmd += [*extra_args, '-metadata', 'artist=Football Analytics', output_path]
+        return subprocess.Popen(ffmpeg_cmd, stdin=subprocess.PIPE)
+
+    @staticmethod
+    def close_ffmpeg_pipe(ffmpeg):
+        """Flush the remaining frames and fail loudly if encoding went wrong"""
+        ffmpeg.stdin.close()
+        if ffmpeg.wait() != 0:
+            raise RuntimeError(f"ffmpeg exited with code {ffmpeg.returncode}")
+
+    def render_frames_serial(self, output_path, total_frames, dpi=100, **encode_args):
+        """Render frames in-process, writing each buffer straight into ffmpeg"""
+        self.fig.set_dpi(dpi)
+        self.cache_background()
+
+        ffmpeg = self.open_ffmpeg_pipe(output_path, dpi=dpi, **encode_args)
+        for frame in range(total_frames):
+            ffmpeg.stdin.write(self.render_frame_rgba(frame))
+        self.close_ffmpeg_pipe(ffmpeg)
+
+    def render_frames_parallel(self, output_path, total_frames, workers, dpi=100, **encode_args):
+        """Render frames across worker processes and pipe them to ffmpeg in order"""
+        ffmpeg = self.open_ffmpeg_pipe(output_path, dpi=dpi, **encode_args)
+
+        # Each worker builds its own figure; imap keeps frames in order
+        with multiprocessing.Pool(workers, initializer=_init_render_worker,
+                                  initargs=(self.data_path, self.output_dir, dpi)) as pool:
+            for frame_rgba in pool.imap(_render_frame, range(total_frames), chunksize=8):
+                ffmpeg.stdin.write(frame_rgba)
+
+        self.close_ffmpeg_pipe(ffmpeg)
+
+    def create_animation(self, quality='final', workers=None):
+        """Create the full animation ('final' for release, 'draft' for quick previews)"""
+        preset = self.quality_presets[quality]
+        workers = workers or os.cpu_count() or 1
         self.load_and_prepare_data()
 
         # Setup the plot first
         self.setup_mobile_plot()
 
-        # Calculate total duration and frames
-        total_duration = (self.intro_duration + self.baseline_duration +
-                         len(self.match_data) * self.match_duration + self.finale_duration)
-        total_frames = int(total_duration * 30)  # 30 fps
-
-        print(f"Creating animation with {total_frames} frames ({total_duration} seconds)")
-
-        # Create animation
-        anim = animation.FuncAnimation(self.fig, self.animate_frame,
-                                     frames=total_frames, interval=33, repeat=False)
+        total_frames = self.total_frames
+        print(f"Creating animation with {total_frames} frames ({self.total_duration} seconds)")
 
         # Save as high-quality video
         output_path = os.path.join(self.output_dir, 'wirtz_performance_animation.mp4')
 
-        # Use high-quality settings for social media
-        Writer = animation.writers['ffmpeg']
-        writer = Writer(fps=30, metadata=dict(artist='Football Analytics'), bitrate=8000)
+        # Encode into RAM-backed scratch space, then move the finished file into place
+        with tempfile.TemporaryDirectory(dir=staging_dir()) as scratch_dir:
+            staged_path = os.path.join(scratch_dir, os.path.basename(output_path))
 
-        anim.save(output_path, writer=writer, dpi=100)
+            if workers > 1:
+                # Frames are independent, so rasterize them on all cores
+                print(f"Rendering {quality} frames with {workers} worker processes")
+                self.render_frames_parallel(staged_path, total_frames, workers, **preset)
+            else:
+                print(f"Rendering {quality} frames in-process")
+                self.render_frames_serial(staged_path, total_frames, **preset)
+
+            shutil.move(staged_path, output_path)
 
         print(f"Animation saved to: {output_path}")
         plt.close()
 
         return output_path
 
+def staging_dir():
+    """Directory for intermediate video files, preferring tmpfs when available"""
+    return '/dev/shm' if os.path.isdir('/dev/shm') else tempfile.gettempdir()
+
+
+_worker_creator = None
+
+
+def _init_render_worker(data_path, output_dir, dpi):
+    """Build a private figure with all artists in a render worker process"""
+    global _worker_creator
+    _worker_creator = WirtzAnimationCreator(data_path, output_dir)
+    _worker_creator.load_and_prepare_data(verbose=False)
+    _worker_creator.setup_mobile_plot(verbose=False)
+    _worker_creator.fig.set_dpi(dpi)
+    _worker_creator.cache_background()
+
+
+def _render_frame(frame):
+    """Render one frame in a worker and return its raw RGBA bytes"""
+    return _worker_creator.render_frame_rgba(frame)
+
+
 def main():
     """Main execution function"""
+    parser = argparse.ArgumentParser(description='Render the Florian Wirtz performance animation')
+    parser.add_argument('--quality', choices=sorted(WirtzAnimationCreator.quality_presets), default='final',
+                        help="'draft' renders a smaller, faster-encoded preview")
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Number of render processes (default: all cores, 1 = in-process)')
+    args = parser.parse_args()
+
     script_dir = os.path.dirname(os.path.abspath(__file__))
     data_path = os.path.join(script_dir, '..', 'data', 'wirtz_performance_data.csv')
     output_dir = os.path.join(script_dir, '..', 'video')
@@ -312,7 +436,7 @@ def main():
 
     # Create the animation
     creator = WirtzAnimationCreator(data_path, output_dir)
-    video_path = creator.create_animation()
+    video_path = creator.create_animation(quality=args.quality, workers=args.workers)
 
     print(f"\nVideo created successfully!")
     print(f"Output: {video_path}")
@@ -4,16 +4,22 @@ Create a YouTube Short (9:16 ratio) with title, video, and subtitles using Movie
 Modularized script with separate functions for each component.
 """
 
-from moviepy import VideoFileClip, TextClip, CompositeVideoClip, ColorClip
+from moviepy import VideoFileClip, TextClip, ImageClip, CompositeVideoClip, ColorClip
+from PIL import Image, ImageDraw, ImageFont
+import numpy as np
 import os
 import json
+import shutil
+from functools import lru_cache
+import tempfile
+from create_animated_video import staging_dir
 
 TITLE_FONT_SIZE = 60
 SUBTITLE_FONT_SIZE = 40
 
 def load_source_video(video_path):
-    """Load and return the source video clip."""
-    return VideoFileClip(video_path)
+    """Load and return the source video clip (the animation has no audio track)."""
+    return VideoFileClip(video_path, audio=False)
 
 
 def load_video_metadata(metadata_path):
@@ -27,34 +33,42 @@ def create_background(width, height, duration, color=(0, 0, 0)):
     return ColorClip(size=(width, height), color=color, duration=duration)
 
 
-def calculate_video_dimensions(source_video, final_width, final_height):
-    """Calculate the optimal dimensions and position for the source video."""
-    source_width, source_height = source_video.size
-    source_aspect_ratio = source_width / source_height
-
+@lru_cache(maxsize=None)
+def fit_video_dimensions(source_width, source_height, final_width, final_height):
+    """Integer layout of the source video inside the final frame, with even sizes for x264."""
     # Reserve space for title (5% spacing + text) and subtitles (5% spacing + text)
     # Allocate roughly 15% for title area and 15% for subtitle area
-    available_height = final_height * 0.7  # 70% of total height for video
-    available_width = final_width * 0.9    # 90% of width with some padding
+    available_height = final_height * 7 // 10  # 70% of total height for video
+    available_width = final_width * 9 // 10    # 90% of width with some padding
 
-    # Scale video to fit available space
-    if source_aspect_ratio > (available_width / available_height):
+    # Scale video to fit available space (compare aspect ratios by cross-multiplying)
+    if source_width * available_height > available_width * source_height:
         # Video is wider, fit to width
-        video_width = int(available_width)
-        video_height = int(available_width / source_aspect_ratio)
+        video_width = available_width
+        video_height = available_width * source_height // source_width
     else:
         # Video is taller, fit to height
-        video_height = int(available_height)
-        video_width = int(available_height * source_aspect_ratio)
+        video_height = available_height
+        video_width = available_height * source_width // source_height
+
+    # yuv420p needs even dimensions; snapping here avoids an extra rescale in the encoder
+    video_width -= video_width % 2
+    video_height -= video_height % 2
 
     # Calculate position (center of middle section)
     # Start at 15% down (title area) and center within the available space
-    video_y_position = (final_height * 0.15) + (available_height - video_height) // 2
+    video_y_position = final_height * 15 // 100 + (available_height - video_height) // 2
     video_x_position = (final_width - video_width) // 2
 
     return video_width, video_height, video_x_position, video_y_position
 
 
+def calculate_video_dimensions(source_video, final_width, final_height):
+    """Calculate the optimal dimensions and position for the source video."""
+    source_width, source_height = source_video.size
+    return fit_video_dimensions(source_width, source_height, final_width, final_height)
+
+
 def resize_and_position_video(source_video, width, height, x_pos, y_pos):
     """Resize the source video and position it."""
     resized_video = source_video.resized((width, height))
@@ -75,6 +89,16 @@ def create_title_text(text, duration, final_height, video_y_pos):
     return title_text.with_position(('center', title_y_pos)).with_duration(duration)
 
 
+def render_text_image(text, font, color=(255, 255, 255, 255)):
+    """Rasterize text once into a tightly cropped RGBA array."""
+    measure = ImageDraw.Draw(Image.new('RGBA', (1, 1)))
+    left, top, right, bottom = measure.multiline_textbbox((0, 0), text, font=font)
+
+    image = Image.new('RGBA', (max(right - left, 1), max(bottom - top, 1)), (0, 0, 0, 0))
+    ImageDraw.Draw(image).multiline_text((-left, -top), text, font=font, fill=color)
+    return np.array(image)
+
+
 def create_subtitle_clips(subtitles, total_duration, final_width, final_height, video_y_pos, video_height):
     """Create multiple subtitle text clips timed throughout the video."""
     subtitle_clips = []
@@ -85,14 +109,14 @@ def create_subtitle_clips(subtitles, total_duration, final_width, final_height,
     # Calculate timing for each subtitle
     subtitle_duration = total_duration / len(subtitles)
 
-    for i, subtitle_text in enumerate(subtitles):
+    # Load the font once and rasterize every subtitle up front
+    font = ImageFont.load_default(size=SUBTITLE_FONT_SIZE)
+    rendered_subtitles = [render_text_image(text, font) for text in subtitles]
+
+    for i, rendered in enumerate(rendered_subtitles):
         start_time = i * subtitle_duration
 
-        subtitle_clip = TextClip(
-            text=subtitle_text,
-            font_size=SUBTITLE_FONT_SIZE,
-            color='white'
-        )
+        subtitle_clip = ImageClip(rendered)
 
         # Get actual text dimensions for proper positioning
         text_width, text_height = subtitle_clip.size
@@ -128,9 +152,9 @@ def export_video(final_video, output_path):
         output_path,
         fps=24,
         codec='libx264',
-        audio_codec='aac',
-        temp_audiofile='temp-audio.m4a',
-        remove_temp=True
+        audio=False,
+        preset='veryfast',
+        threads=os.cpu_count()
     )
 
 
@@ -156,14 +180,14 @@ def create_youtube_short():
     # Load source video
     source_video = load_source_video(input_video_path)
 
-    # Create background
-    background = create_background(final_width, final_height, source_video.duration)
-
     # Calculate video dimensions and position
     video_width, video_height, video_x_pos, video_y_pos = calculate_video_dimensions(
         source_video, final_width, final_height
     )
 
+    # Create background
+    background = create_background(final_width, final_height, source_video.duration)
+
     # Resize and position the video
     positioned_video = resize_and_position_video(
         source_video, video_width, video_height, video_x_pos, video_y_pos
@@ -183,8 +207,11 @@ def create_youtube_short():
     # Compose final video
     final_video = compose_final_video(background, positioned_video, title_text, subtitle_clips)
 
-    # Export the video
-    export_video(final_video, output_video_path)
+    # Export the video via scratch space, then move the finished file into place
+    with tempfile.TemporaryDirectory(dir=staging_dir()) as scratch_dir:
+        staged_path = os.path.join(scratch_dir, os.path.basename(output_video_path))
+        export_video(final_video, staged_path)
+        shutil.move(staged_path, output_video_path)
 
     # Clean up resources
     cleanup_resources(source_video, final_video)
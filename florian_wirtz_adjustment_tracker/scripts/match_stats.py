@@ -24,21 +24,63 @@ Touches in the Attacking Penalty Area per 90: A simple but powerful metric. Is h
 Successful Take-Ons / Dribbles Completed: Wirtz is known for his ability to glide past players. Is he still attempting and completing these dribbles? This shows his confidence and willingness to take risks in the final third.
 """
 
-from functools import reduce
-from typing import List, Tuple, Dict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from functools import lru_cache
+from typing import List, Tuple, Dict, Optional, Set
+import hashlib
 import os
+import pickle
+import sys
 
 import pandas as pd
+import matplotlib
+
+# Without a display (e.g. Linux servers/CI) use Agg so no GUI toolkit gets loaded
+HEADLESS = sys.platform.startswith('linux') and not (os.environ.get('DISPLAY') or os.environ.get('WAYLAND_DISPLAY'))
+if HEADLESS:
+    matplotlib.use('Agg')
+
 import matplotlib.pyplot as plt
 import numpy as np
 from matplotlib.patches import Rectangle
+from matplotlib.patheffects import withStroke
 import seaborn as sns
 
 
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def cached_read_html(url: str, match: str = '.+') -> List[pd.DataFrame]:
+    """Read HTML tables matching `match` from a URL, reusing today's parsed result from the on-disk cache."""
+    cache_dir = os.path.join(SCRIPT_DIR, '..', 'data', 'cache')
+    url_hash = hashlib.sha256(f"{url}|{match}".encode('utf-8')).hexdigest()[:16]
+    cache_path = os.path.join(cache_dir, f"{url_hash}_{date.today().isoformat()}.pkl")
+
+    if os.path.exists(cache_path):
+        with open(cache_path, 'rb') as f:
+            return pickle.load(f)
+
+    # lxml is the fast C parser; `match` skips tables we never look at
+    tables = pd.read_html(url, flavor='lxml', match=match)
+    os.makedirs(cache_dir, exist_ok=True)
+    with open(cache_path, 'wb') as f:
+        pickle.dump(tables, f)
+
+    # Drop earlier days' entries for this URL so the cache holds one file per URL
+    for name in os.listdir(cache_dir):
+        if name.startswith(f"{url_hash}_") and name != os.path.basename(cache_path):
+            os.remove(os.path.join(cache_dir, name))
+    return tables
+
+
 def read_data() -> Tuple[List[pd.DataFrame], List[pd.DataFrame]]:
     """Read scout report and match logs data from fbref URLs."""
+    # fbref's "Get as CSV" option is built in the browser by JavaScript from the
+    # rendered table; there is no CSV endpoint to download, so the HTML tables
+    # are parsed directly (and cached by cached_read_html).
     scout_report_url = "https://fbref.com/en/players/e7fcf289/dom_lg/Florian-Wirtz-Domestic-League-Stats#all_stats_gca"
-    tables = pd.read_html(scout_report_url)
+    tables = cached_read_html(scout_report_url, match='Season')
 
     match_logs_url = [
         "https://fbref.com/en/players/e7fcf289/matchlogs/2025-2026/Florian-Wirtz-Match-Logs",
@@ -46,19 +88,22 @@ def read_data() -> Tuple[List[pd.DataFrame], List[pd.DataFrame]]:
         "https://fbref.com/en/players/e7fcf289/matchlogs/2025-2026/possession/Florian-Wirtz-Match-Logs",
     ]
 
-    match_logs = []
-    for url in match_logs_url:
-        match_logs.extend(pd.read_html(url))
+    # Fetch the match logs concurrently; map preserves URL order, which
+    # transform_match_log_data relies on
+    with ThreadPoolExecutor(max_workers=len(match_logs_url)) as executor:
+        results = list(executor.map(lambda url: cached_read_html(url, match='Date'), match_logs_url))
+    match_logs = [table for tables_per_url in results for table in tables_per_url]
 
     return tables, match_logs
 
 
+@lru_cache(maxsize=1)
 def get_column_mappings() -> Dict:
-    """Define column mappings for data extraction."""
+    """Define column mappings for data extraction (cached; sequences are tuples so they can be shared)."""
     return {
         'season_col': ('Unnamed: 0_level_0', 'Season'),
         'per90_col': ('Unnamed: 6_level_0', '90s'),
-        'seasons': ["2023-2024", "2024-2025", "2025-2026"],
+        'seasons': ("2023-2024", "2024-2025", "2025-2026"),
         # Pillar 1: Creative Influence & On-Ball Value
         'SCA': ('SCA', 'SCA'),  # Shot-Creating Actions (SCA) per 90
         'xA': ('Expected', 'xA'),  # Expected Assists (xA) per 90
@@ -73,47 +118,67 @@ def get_column_mappings() -> Dict:
     }
 
 
+@lru_cache(maxsize=1)
 def get_match_log_mappings() -> Dict:
-    """Define column mappings for match log data."""
+    """Define column mappings for match log data (cached; sequences are tuples so they can be shared)."""
     return {
-        'match_cols': [
+        'match_cols': (
             ('Unnamed: 0_level_0', 'Date'),
             ('Unnamed: 2_level_0', 'Comp'),
             ('Unnamed: 7_level_0', 'Opponent'),
             ('Unnamed: 10_level_0', 'Min'),
-        ],
-        'match_cols_name': ["date", "comp", "opponent", "min"],
-        'metrics_summary': [
+        ),
+        'match_cols_name': ("date", "comp", "opponent", "min"),
+        'metrics_summary': (
             ('Expected', 'npxG'),
             ('SCA', 'SCA'),
             ('Take-Ons', 'Att'),
             ('Take-Ons', 'Succ'),
-        ],
-        'metrics_summary_name': ["npxG", "SCA", "takeOnsAtt", "takeOnsSucc"],
-        'metrics_passing': [
+        ),
+        'metrics_summary_name': ("npxG", "SCA", "takeOnsAtt", "takeOnsSucc"),
+        'metrics_passing': (
             ('Unnamed: 27_level_0', 'xA'),
             ('Unnamed: 29_level_0', '1/3'),
             ('Unnamed: 30_level_0', 'PPA'),
             ('Unnamed: 32_level_0', 'PrgP'),
-        ],
-        'metrics_passing_name': ["xA", "passFin3", "PPA", "PrgP"],
-        'metrics_possession': [
+        ),
+        'metrics_passing_name': ("xA", "passFin3", "PPA", "PrgP"),
+        'metrics_possession': (
             ('Touches', 'Att Pen'),
-        ],
-        'metrics_possession_name': ["touchesAttPen"]
+        ),
+        'metrics_possession_name': ("touchesAttPen",)
     }
 
 
-def find_table_by_columns(tables: List[pd.DataFrame], required_columns: List[tuple]) -> pd.DataFrame:
-    """Find the table that contains all required columns."""
-    for table in tables:
+def build_column_index(tables: List[pd.DataFrame]) -> Dict[tuple, Set[int]]:
+    """Map each column label to the positions of the tables that contain it."""
+    column_index = {}
+    for i, table in enumerate(tables):
         try:
-            # Check if all required columns exist in this table
-            if all(col in table.columns for col in required_columns):
-                return table
+            for col in table.columns:
+                column_index.setdefault(col, set()).add(i)
         except (AttributeError, TypeError):
             # Skip tables that don't have proper column structure
             continue
+    return column_index
+
+
+def find_table_by_columns(tables: List[pd.DataFrame], required_columns: List[tuple],
+                          column_index: Optional[Dict[tuple, Set[int]]] = None) -> pd.DataFrame:
+    """Find the first table that contains all required columns."""
+    if column_index is None:
+        column_index = build_column_index(tables)
+
+    # Intersect the tables holding each required column
+    candidates = None
+    for col in required_columns:
+        positions = column_index.get(col, set())
+        candidates = set(positions) if candidates is None else candidates & positions
+        if not candidates:
+            break
+
+    if candidates:
+        return tables[min(candidates)]
 
     # If no table found, raise an error with helpful message
     col_names = [str(col) for col in required_columns]
@@ -126,31 +191,32 @@ def transform_season_data(tables: List[pd.DataFrame]) -> List[pd.DataFrame]:
     season_col = cols['season_col']
     per90_col = cols['per90_col']
     seasons = cols['seasons']
+    column_index = build_column_index(tables)
 
     # Goal and shot creation metrics
     gca_cols = [season_col, per90_col, cols['SCA']]
-    gca = find_table_by_columns(tables, gca_cols)
+    gca = find_table_by_columns(tables, gca_cols, column_index)
     ix = gca[season_col].isin(seasons)
     gca_metric = gca[ix][gca_cols].reset_index(drop=True)
     gca_metric.columns = ["season", "m90s", "SCA"]
 
     # Passing metrics
     passing_cols = [season_col, per90_col, cols['xA'], cols['passFin3'], cols['PPA'], cols['PrgP']]
-    passing = find_table_by_columns(tables, passing_cols)
+    passing = find_table_by_columns(tables, passing_cols, column_index)
     ix = passing[season_col].isin(seasons)
     passing_metric = passing[ix][passing_cols].reset_index(drop=True)
     passing_metric.columns = ["season", "m90s", "xA", "passFin3", "PPA", "PrgP"]
 
     # Shooting metrics
     shooting_cols = [season_col, per90_col, cols['npxG']]
-    shooting = find_table_by_columns(tables, shooting_cols)
+    shooting = find_table_by_columns(tables, shooting_cols, column_index)
     ix = shooting[season_col].isin(seasons)
     shooting_metric = shooting[ix][shooting_cols]
     shooting_metric.columns = ["season", "m90s", "npxG"]
 
     # Possession metrics
     possession_cols = [season_col, per90_col, cols['touchesAttPen'], cols['takeOnsAtt'], cols['takeOnsSucc']]
-    possession = find_table_by_columns(tables, possession_cols)
+    possession = find_table_by_columns(tables, possession_cols, column_index)
     ix = possession[season_col].isin(seasons)
     possession_metric = possession[ix][possession_cols].reset_index(drop=True)
     possession_metric.columns = ["season", "m90s", "touchesAttPen", "takeOnsAtt", "takeOnsSucc"]
@@ -160,9 +226,8 @@ def transform_season_data(tables: List[pd.DataFrame]) -> List[pd.DataFrame]:
 
 def clean_match_log_metrics(data: pd.DataFrame, metrics: List[tuple], metrics_cols_name: List[str], match_cols: List[tuple], match_cols_name: List[str]) -> pd.DataFrame:
     """Clean and structure match log metrics data."""
-    _data = data[match_cols + metrics]
-    _data = _data[_data.notna().all(axis=1)]
-    _data.columns = match_cols_name + metrics_cols_name
+    _data = data[list(match_cols) + list(metrics)].dropna(how='any')
+    _data.columns = list(match_cols_name) + list(metrics_cols_name)
     return _data
 
 
@@ -189,83 +254,88 @@ def transform_match_log_data(match_logs: List[pd.DataFrame]) -> List[pd.DataFram
 def join_data(dataframes: List[pd.DataFrame]) -> pd.DataFrame:
     """Join multiple dataframes on common columns."""
     if 'season' in dataframes[0].columns:
-        return reduce(lambda left, right: pd.merge(left, right, on=['season', 'm90s'], how='inner'), dataframes)
+        keys = ['season', 'm90s']
     else:
         mappings = get_match_log_mappings()
-        match_cols_name = mappings['match_cols_name']
-        return reduce(lambda left, right: pd.merge(left, right, on=match_cols_name, how='inner'), dataframes)
-
+        keys = list(mappings['match_cols_name'])
 
-def apply_cii_metric(data: pd.DataFrame) -> pd.Series:
-    """Calculate Creative Impact Index (CII) metric."""
-    cii_metrics = ["SCA", "xA", "PPA", "PrgP"]
-    return data[cii_metrics].sum(axis=1) / len(cii_metrics)
+    # Align every frame on the key columns and join them in one pass
+    return pd.concat([df.set_index(keys) for df in dataframes], axis=1, join='inner').reset_index()
 
 
-def apply_gti_metric(data: pd.DataFrame) -> pd.Series:
-    """Calculate Goal Threat Index (GTI) metric."""
-    gti_metrics = ['npxG', 'touchesAttPen', 'takeOnsAtt', 'takeOnsSucc']
-    return data[gti_metrics].sum(axis=1) / len(gti_metrics)
+CII_METRICS = ["SCA", "xA", "PPA", "PrgP"]
+GTI_METRICS = ['npxG', 'touchesAttPen', 'takeOnsAtt', 'takeOnsSucc']
 
 
-def normalize_to_per90(data: pd.DataFrame, is_match_log: bool = False) -> pd.DataFrame:
-    """Normalize metrics to per 90 minutes."""
-    if is_match_log:
-        mappings = get_match_log_mappings()
-        match_cols_name = mappings['match_cols_name']
-        cols_to_divide = data.columns.drop(match_cols_name)
-        data_per90 = data.copy()
-        data_per90[cols_to_divide] = data_per90[cols_to_divide].apply(pd.to_numeric, errors='coerce')
-        data_per90[cols_to_divide] = data_per90[cols_to_divide].div(data_per90['min'] / 90, axis=0)
-    else:
-        cols_to_divide = data.columns.drop(['season'])
-        data_per90 = data.copy()
-        data_per90[cols_to_divide] = data_per90[cols_to_divide].apply(pd.to_numeric, errors='coerce')
-        data_per90[cols_to_divide] = data_per90[cols_to_divide].div(data_per90['m90s'], axis=0)
+def compute_impact_indices(values: np.ndarray, m90s: np.ndarray, baseline: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Compute CII and GTI straight from raw metric values in a single pass.
 
-    return data_per90
+    `values` holds the CII_METRICS + GTI_METRICS columns, `m90s` the 90-minute units
+    played per row and `baseline` the per-90 baseline for each metric. The mean of
+    values / (m90s * baseline) over an index's metrics is a dot product with
+    1 / baseline, so no per-90 or normalized table is materialized.
+    The dot products already run as one native loop per index, so this stays in
+    plain NumPy rather than a JIT-compiled kernel.
+    """
+    # Row-major float32 so each dot product walks memory contiguously
+    values = np.ascontiguousarray(values, dtype=np.float32)
+    inv_baseline = 1 / baseline
+    n_cii = len(CII_METRICS)
+    cii = values[:, :n_cii] @ inv_baseline[:n_cii] / (n_cii * m90s)
+    gti = values[:, n_cii:] @ inv_baseline[n_cii:] / (len(GTI_METRICS) * m90s)
+    return cii, gti
 
 
 def organize_and_clean_data(season_data: pd.DataFrame, match_log_data: pd.DataFrame) -> pd.DataFrame:
     """Organize and clean all data, normalize metrics, and prepare final dataset for plotting."""
-    mappings = get_match_log_mappings()
-    match_cols_name = mappings['match_cols_name']
+    metric_cols = CII_METRICS + GTI_METRICS
 
-    # Normalize season data to per 90
-    season_data_per90 = normalize_to_per90(season_data, is_match_log=False)
-    cols_to_divide = season_data_per90.columns.drop(['season'])
-    season_data_norm = season_data_per90[cols_to_divide] / season_data_per90[cols_to_divide].iloc[0]
-    season_data_norm["CII"] = apply_cii_metric(season_data_norm)
-    season_data_norm["GTI"] = apply_gti_metric(season_data_norm)
+    # Raw metric blocks and 90-minute units played, as float32 arrays
+    season_values = season_data[metric_cols].apply(pd.to_numeric, errors='coerce').to_numpy(dtype=np.float32)
+    season_m90s = pd.to_numeric(season_data['m90s'], errors='coerce').to_numpy(dtype=np.float32)
+    match_values = match_log_data[metric_cols].apply(pd.to_numeric, errors='coerce').to_numpy(dtype=np.float32)
+    match_m90s = pd.to_numeric(match_log_data['min'], errors='coerce').to_numpy(dtype=np.float32) / np.float32(90)
 
-    # Normalize match log data to per 90
-    match_log_per90 = normalize_to_per90(match_log_data, is_match_log=True)
+    # The first season's per-90 output is the baseline for everything
+    baseline = season_values[0] / season_m90s[0]
 
-    # Normalize match log data against baseline
-    match_log_norm = match_log_per90.copy()
-    baseline_metric = season_data_per90.iloc[0]
-    cols_to_divide_ml = match_log_per90.columns.drop(match_cols_name)
+    # Per-90 normalization, baseline division and index averaging fused per dataset
+    season_cii, season_gti = compute_impact_indices(season_values, season_m90s, baseline)
+    match_cii, match_gti = compute_impact_indices(match_values, match_m90s, baseline)
 
-    for col in cols_to_divide_ml:
-        match_log_norm[col] = match_log_norm[col] / baseline_metric[col]
+    # Combine season and match data
+    match_summary = pd.DataFrame({
+        'opponent': match_log_data['opponent'].to_numpy(),
+        'CII': match_cii,
+        'GTI': match_gti,
+    })
+    season_summary = pd.DataFrame({
+        'opponent': ['2023-2024', '2024-2025'],
+        'CII': season_cii[:2],
+        'GTI': season_gti[:2],
+    })
+
+    df = pd.concat([match_summary, season_summary], ignore_index=True)
 
-    match_log_norm["CII"] = apply_cii_metric(match_log_norm)
-    match_log_norm["GTI"] = apply_gti_metric(match_log_norm)
+    return df
 
-    # Combine season and match data
-    season_summary = season_data_norm[["CII", "GTI"]].head(2)
-    season_summary['opponent'] = ['2023-2024', '2024-2025']
 
-    df = pd.concat([match_log_norm[['opponent', 'CII', 'GTI']], season_summary], ignore_index=True)
+_STYLE_APPLIED = False
 
-    return df
+
+def apply_plot_style() -> None:
+    """Apply the global matplotlib/seaborn style once per process."""
+    global _STYLE_APPLIED
+    if not _STYLE_APPLIED:
+        plt.style.use('dark_background')
+        sns.set_palette("husl")
+        _STYLE_APPLIED = True
 
 
 def plot_performance_data(df: pd.DataFrame) -> None:
     """Create a visualization of Wirtz's performance data."""
     # Set the style for a modern look
-    plt.style.use('dark_background')
-    sns.set_palette("husl")
+    apply_plot_style()
 
     # Create the figure with a square size
     fig, ax = plt.subplots(figsize=(12, 12))
@@ -284,18 +354,13 @@ def plot_performance_data(df: pd.DataFrame) -> None:
                         linewidth=1.5,
                         zorder=3)
 
-    # Add a subtle glow effect around points
-    ax.scatter(df['CII'], df['GTI'],
-              c=colors,
-              s=200,
-              alpha=0.2,
-              edgecolors='none',
-              zorder=2)
+    # Add a subtle glow effect around points (stroked halo on the same artist)
+    scatter.set_path_effects([withStroke(linewidth=6, foreground='white', alpha=0.2)])
 
     # Annotate points with better styling
-    for i, row in df.iterrows():
-        ax.annotate(row['opponent'],
-                    (row['CII'], row['GTI']),
+    for opponent, cii, gti in zip(df['opponent'].to_numpy(), df['CII'].to_numpy(), df['GTI'].to_numpy()):
+        ax.annotate(opponent,
+                    (cii, gti),
                     xytext=(9, 9),
                     textcoords='offset points',
                     fontsize=18,
@@ -368,7 +433,8 @@ def plot_performance_data(df: pd.DataFrame) -> None:
                        left=0.12,
                        right=0.95)
 
-    plt.show()
+    if not HEADLESS:
+        plt.show()
 
 
 def main():
@@ -388,8 +454,7 @@ def main():
     final_data = organize_and_clean_data(season_data, match_log_data)
 
     # Save final data to CSV
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    data_dir = os.path.join(script_dir, '..', 'data')
+    data_dir = os.path.join(SCRIPT_DIR, '..', 'data')
     os.makedirs(data_dir, exist_ok=True)
     output_path = os.path.join(data_dir, 'wirtz_performance_data.csv')
     final_data.to_csv(output_path, index=False)
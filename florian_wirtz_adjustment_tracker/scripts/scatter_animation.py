@@ -2,16 +2,17 @@ import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.animation as animation
 from matplotlib.collections import LineCollection
-import random
 
 def generate_random_data(n_points=50):
     """Generate random x, y data with timestamps"""
+    rng = np.random.default_rng()
+
     # Generate random timestamps (sorted)
-    timestamps = sorted([random.uniform(0, 10) for _ in range(n_points)])
+    timestamps = np.sort(rng.uniform(0, 10, n_points))
 
     # Generate random x, y coordinates
-    x_data = [random.uniform(-10, 10) for _ in range(n_points)]
-    y_data = [random.uniform(-10, 10) for _ in range(n_points)]
+    x_data = rng.uniform(-10, 10, n_points)
+    y_data = rng.uniform(-10, 10, n_points)
 
     return timestamps, x_data, y_data
 
@@ -33,92 +34,79 @@ def create_scatter_animation():
     scatter = ax.scatter([], [], c=[], s=50, cmap='viridis', alpha=0.7)
     line, = ax.plot([], [], 'b-', alpha=0.5, linewidth=2)
     pointer, = ax.plot([], [], 'ro', markersize=12, markeredgecolor='white', markeredgewidth=2)
-
-    # Store data for animation
-    x_points = []
-    y_points = []
-    colors = []
+    # Progress text lives inside the axes so it is covered by the blitted region
+    status = ax.text(0.5, 0.98, '', transform=ax.transAxes, ha='center', va='top')
+
+    # Point buffers for the scatter; the first `filled` entries are the visited points
+    n_points = len(timestamps)
+    offsets = np.empty((n_points, 2))
+    colors_arr = np.empty(n_points)
+    filled = 0
+
+    def fill_to(count):
+        """Copy points up to `count` into the buffers and refresh the visited artists"""
+        nonlocal filled
+        if count <= filled:
+            return
+        offsets[filled:count, 0] = x_data[filled:count]
+        offsets[filled:count, 1] = y_data[filled:count]
+        colors_arr[filled:count] = timestamps[filled:count]
+        filled = count
+
+        scatter.set_offsets(offsets[:filled])
+        scatter.set_array(colors_arr[:filled])
+        line.set_data(offsets[:filled, 0], offsets[:filled, 1])
 
     # Animation parameters
     frames_per_segment = 3  # Number of frames to move between points (reduced from 20 for 8x speed)
     total_segments = len(timestamps) - 1 if len(timestamps) > 1 else 0
 
-    def interpolate_position(start_pos, end_pos, t):
-        """Interpolate between two positions"""
-        return start_pos + t * (end_pos - start_pos)
+    # Precompute the pointer trajectory: one interpolated position/time per frame
+    move_frames = np.arange(total_segments * frames_per_segment)
+    frame_segment = np.minimum(move_frames // frames_per_segment, max(len(timestamps) - 2, 0))
+    frame_progress = (move_frames % frames_per_segment) / frames_per_segment
+    if total_segments:
+        pointer_x = x_data[frame_segment] + frame_progress * (x_data[frame_segment + 1] - x_data[frame_segment])
+        pointer_y = y_data[frame_segment] + frame_progress * (y_data[frame_segment + 1] - y_data[frame_segment])
+        pointer_time = (timestamps[frame_segment]
+                        + frame_progress * (timestamps[frame_segment + 1] - timestamps[frame_segment]))
 
     def animate(frame):
         """Animation function called for each frame"""
         if total_segments == 0:
-            return scatter, line, pointer
+            return scatter, line, pointer, status
 
         total_frames = total_segments * frames_per_segment
 
         if frame < total_frames:
-            # Calculate which segment we're in and progress within that segment
-            segment_index = frame // frames_per_segment
-            segment_progress = (frame % frames_per_segment) / frames_per_segment
-
-            # Ensure we don't go beyond available data
-            segment_index = min(segment_index, len(timestamps) - 2)
-
-            # Add points up to current segment
-            target_points = segment_index + 1
-            while len(x_points) < target_points:
-                idx = len(x_points)
-                x_points.append(x_data[idx])
-                y_points.append(y_data[idx])
-                colors.append(timestamps[idx])
-
-            # Update scatter plot with visited points
-            if x_points:
-                scatter.set_offsets(np.column_stack([x_points, y_points]))
-                scatter.set_array(np.array(colors))
-
-                # Update line connecting visited points
-                line.set_data(x_points, y_points)
-
-            # Calculate current pointer position with smooth interpolation
-            start_x = x_data[segment_index]
-            start_y = y_data[segment_index]
-            end_x = x_data[segment_index + 1]
-            end_y = y_data[segment_index + 1]
-
-            current_x = interpolate_position(start_x, end_x, segment_progress)
-            current_y = interpolate_position(start_y, end_y, segment_progress)
-
-            # Update pointer position
-            pointer.set_data([current_x], [current_y])
-
-            # Update title with current position and progress
-            current_time = interpolate_position(timestamps[segment_index],
-                                             timestamps[segment_index + 1],
-                                             segment_progress)
-            ax.set_title(f'Smooth Pointer Animation - Time: {current_time:.2f} - Segment: {segment_index + 1}/{total_segments}')
+            # Segment we're in (clamped to available data when precomputed)
+            segment_index = frame_segment[frame]
+
+            # Add points up to current segment (updates scatter and connecting line)
+            fill_to(segment_index + 1)
+
+            # Update pointer position from the precomputed trajectory
+            pointer.set_data(pointer_x[frame:frame + 1], pointer_y[frame:frame + 1])
+
+            # Update status with current position and progress
+            status.set_text(f'Time: {pointer_time[frame]:.2f} - Segment: {segment_index + 1}/{total_segments}')
 
         elif frame < total_frames + 30:  # Pause at end
             # Show final state with all points
-            if len(x_points) < len(timestamps):
-                x_points.extend(x_data[len(x_points):])
-                y_points.extend(y_data[len(y_points):])
-                colors.extend(timestamps[len(colors):])
-
-                scatter.set_offsets(np.column_stack([x_points, y_points]))
-                scatter.set_array(np.array(colors))
-                line.set_data(x_points, y_points)
+            fill_to(n_points)
 
             # Keep pointer at final position
-            if x_data:
+            if len(x_data):
                 pointer.set_data([x_data[-1]], [y_data[-1]])
-            ax.set_title(f'Animation Complete - Final Time: {timestamps[-1]:.2f}')
+            status.set_text(f'Animation Complete - Final Time: {timestamps[-1]:.2f}')
 
-        return scatter, line, pointer
+        return scatter, line, pointer, status
 
     # Create animation with more frames for smooth motion
     total_frames = total_segments * frames_per_segment + 30  # +30 for pause at end
     anim = animation.FuncAnimation(
         fig, animate, frames=total_frames,
-        interval=50, blit=False, repeat=True  # Faster interval for smoother motion
+        interval=50, blit=True, repeat=True  # Faster interval for smoother motion
     )
 
     return fig, anim
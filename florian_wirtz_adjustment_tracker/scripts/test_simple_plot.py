@@ -2,10 +2,30 @@
 Simple test to debug the scatter plot visualization
 """
 
+import os
+import sys
+
 import pandas as pd
+import matplotlib
+
+# Without a display (e.g. Linux servers/CI) use Agg so no GUI toolkit gets loaded
+HEADLESS = sys.platform.startswith('linux') and not (os.environ.get('DISPLAY') or os.environ.get('WAYLAND_DISPLAY'))
+if HEADLESS:
+    matplotlib.use('Agg')
+
 import matplotlib.pyplot as plt
 import numpy as np
-import os
+
+_STYLE_APPLIED = False
+
+
+def apply_plot_style():
+    """Apply the global matplotlib style once per process"""
+    global _STYLE_APPLIED
+    if not _STYLE_APPLIED:
+        plt.style.use('dark_background')
+        _STYLE_APPLIED = True
+
 
 def test_simple_plot():
     # Load data
@@ -17,14 +37,15 @@ def test_simple_plot():
     print(df)
 
     # Create a simple plot
-    plt.style.use('dark_background')
+    apply_plot_style()
     fig, ax = plt.subplots(figsize=(10, 8))
     fig.patch.set_facecolor('#0E1117')
     ax.set_facecolor('#0E1117')
 
     # Separate data
-    baseline_data = df[df['opponent'].isin(['2023-2024', '2024-2025'])].copy()
-    match_data = df[~df['opponent'].isin(['2023-2024', '2024-2025'])].copy()
+    is_baseline = df['opponent'].isin({'2023-2024', '2024-2025'})
+    baseline_data = df.loc[is_baseline].copy()
+    match_data = df.loc[~is_baseline].copy()
 
     print(f"\nBaseline data ({len(baseline_data)} points):")
     print(baseline_data[['opponent', 'CII', 'GTI']])
@@ -41,9 +62,9 @@ def test_simple_plot():
                c='red', s=200, alpha=0.9, edgecolors='white', linewidth=2, label='Matches')
 
     # Add labels for all points
-    for _, row in df.iterrows():
-        ax.annotate(row['opponent'],
-                   (row['CII'], row['GTI']),
+    for opponent, cii, gti in zip(df['opponent'].to_numpy(), df['CII'].to_numpy(), df['GTI'].to_numpy()):
+        ax.annotate(opponent,
+                   (cii, gti),
                    xytext=(5, 5), textcoords='offset points',
                    fontsize=10, color='white')
 
@@ -68,7 +89,8 @@ def test_simple_plot():
     plt.savefig(output_path, facecolor='#0E1117', dpi=150, bbox_inches='tight')
     print(f"\nTest plot saved to: {output_path}")
 
-    plt.show()
+    if not HEADLESS:
+        plt.show()
 
 if __name__ == "__main__":
     test_simple_plot()
\ No newline at end of file
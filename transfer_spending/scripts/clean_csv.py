@@ -2,6 +2,9 @@
 import pandas as pd
 import re
 
+# League name followed by an optional "YY/YY" season code at the end
+COMPETITION_PATTERN = re.compile(r'^(.*?)(?:\s+(\d{2}/\d{2}))?\s*$')
+
 def split_competition(competition_str):
     """
     Split competition string into league and season components.
@@ -32,6 +35,23 @@ def split_competition(competition_str):
         # If no season pattern found, treat entire string as league
         return competition_str.strip(), ""
 
+def split_competition_column(competitions):
+    """
+    Vectorized split_competition over a whole Competition column.
+    
+    Args:
+        competitions (pd.Series): Competition strings like "Premier League 22/23"
+        
+    Returns:
+        pd.DataFrame: 'League' and 'Season' columns; missing or non-string
+        entries become empty strings, as in split_competition
+    """
+    extracted = competitions.str.strip().str.extract(COMPETITION_PATTERN)
+    return pd.DataFrame({
+        'League': extracted[0].fillna('').str.strip(),
+        'Season': extracted[1].fillna(''),
+    }, index=competitions.index)
+
 def clean_transfer_data(input_file, output_file):
     """
     Clean the transfer spending CSV by splitting Competition into League and Season.
@@ -40,29 +60,16 @@ def clean_transfer_data(input_file, output_file):
         input_file (str): Path to input CSV file
         output_file (str): Path to output CSV file
     """
-    # Read the CSV file
-    df = pd.read_csv(input_file)
-    
-    # Split the Competition column
-    df[['League', 'Season']] = df['Competition'].apply(
-        lambda x: pd.Series(split_competition(x))
-    )
-    
-    # Reorder columns to put League and Season after Competition
-    cols = df.columns.tolist()
-    
-    # Remove League and Season from their current position
-    cols = [col for col in cols if col not in ['League', 'Season']]
-    
-    # Find the index of Competition column
-    comp_index = cols.index('Competition')
+    # Read the CSV file (Competition as a string column, skipping type inference)
+    df = pd.read_csv(input_file, dtype={'Competition': 'string'})
     
-    # Insert League and Season after Competition
-    cols.insert(comp_index + 1, 'League')
-    cols.insert(comp_index + 2, 'Season')
+    # Split the Competition column in one regex pass
+    split = split_competition_column(df['Competition'])
     
-    # Reorder the dataframe
-    df = df[cols]
+    # Insert League and Season right after Competition
+    comp_index = df.columns.get_loc('Competition')
+    df.insert(comp_index + 1, 'League', split['League'])
+    df.insert(comp_index + 2, 'Season', split['Season'])
     
     # Save the cleaned data
     df.to_csv(output_file, index=False)
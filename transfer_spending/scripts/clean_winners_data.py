@@ -6,20 +6,208 @@ Script to clean and align winners_combined.csv data with transfer_spending_clean
 import pandas as pd
 import os
 import re
+from functools import lru_cache
+
+
+# Season formats found in winners_combined.csv
+SEASON_YYYY_YY = re.compile(r'^(\d{4})-(\d{2})$')      # "2024-25"
+SEASON_YYYY_Y = re.compile(r'^(\d{4})-(\d{1})$')       # "2008-9"
+SEASON_YYYY_YYYY = re.compile(r'^(\d{4})-(\d{4})$')    # "2024-2025"
+SEASON_YY_YY = re.compile(r'^(\d{2})/(\d{2})$')        # "24/25"
+SEASON_YYYY = re.compile(r'^(\d{4})$')                 # "2024"
+
+# Competition name mappings
+COMPETITION_MAPPING = {
+    'Champions League': 'Champions League',  # Keep as is
+    'English Premier League': 'Premier League',
+    'Spain La Liga': 'LaLiga',
+    'France Ligue 1': 'Ligue 1',
+    'Italy Serie A': 'Serie A',
+    'Germany Bundesliga': 'Bundesliga'
+}
+
+# Common club name mappings
+CLUB_MAPPING = {
+    # Premier League
+    'Manchester United': 'Manchester United',
+    'Manchester City': 'Manchester City',
+    'Liverpool': 'Liverpool FC',
+    'Chelsea': 'Chelsea FC',
+    'Arsenal': 'Arsenal FC',
+    'Tottenham Hotspur': 'Tottenham Hotspur',
+    'Aston Villa': 'Aston Villa',
+    'Everton': 'Everton FC',
+    'Leicester City': 'Leicester City',
+    'Brighton & Hove Albion': 'Brighton & Hove Albion',
+    'Newcastle United': 'Newcastle United',
+    'West Ham United': 'West Ham United',
+    'Burnley': 'Burnley FC',
+    'Leeds United': 'Leeds United',
+    'Nottingham Forest': 'Nottingham Forest',
+    'Blackburn Rovers': 'Blackburn Rovers',
+    'Sheffield Wednesday': 'Sheffield Wednesday',
+    'Sheffield United': 'Sheffield United',
+    'Wolverhampton Wanderers': 'Wolverhampton Wanderers',
+    'Huddersfield Town': 'Huddersfield Town',
+    'Ipswich Town': 'Ipswich Town',
+    'Derby County': 'Derby County',
+    'Sunderland': 'Sunderland',
+    'Preston North End': 'Preston North End',
+    'Portsmouth': 'Portsmouth',
+    'West Bromwich Albion': 'West Bromwich Albion',
+    
+    # LaLiga
+    'Real Madrid': 'Real Madrid',
+    'Barcelona': 'FC Barcelona',
+    'FC Barcelona': 'FC Barcelona',
+    'Atletico de Madrid': 'Atlético de Madrid',
+    'Atlético Madrid': 'Atlético de Madrid',
+    'Atlético de Madrid': 'Atlético de Madrid',
+    'Valencia': 'Valencia CF',
+    'Sevilla': 'Sevilla FC',
+    'Athletic Bilbao': 'Athletic Bilbao',
+    'Real Sociedad': 'Real Sociedad',
+    'Villarreal': 'Villarreal CF',
+    'Betis': 'Real Betis',
+    'Deportivo La Coruña': 'Deportivo La Coruña',
+    'Espanyol': 'RCD Espanyol',
+    
+    # Serie A
+    'Juventus': 'Juventus FC',
+    'Juventus FC': 'Juventus FC',
+    'Milan': 'AC Milan',
+    'AC Milan': 'AC Milan',
+    'Inter Milan': 'Inter Milan',
+    'Internazionale': 'Inter Milan',
+    'Napoli': 'SSC Napoli',
+    'SSC Napoli': 'SSC Napoli',
+    'Roma': 'AS Roma',
+    'AS Roma': 'AS Roma',
+    'Lazio': 'Lazio',
+    'Fiorentina': 'Fiorentina',
+    'Atalanta': 'Atalanta BC',
+    'Torino': 'Torino FC',
+    'Genoa': 'Genoa CFC',
+    'Sampdoria': 'Sampdoria',
+    'Bologna': 'Bologna FC',
+    'Cagliari': 'Cagliari',
+    'Hellas Verona': 'Hellas Verona',
+    'Parma': 'AC Parma',
+    
+    # Ligue 1
+    'Paris Saint-Germain': 'Paris Saint-Germain',
+    'Paris Saint-Germain FC': 'Paris Saint-Germain',
+    'Olympique de Marseille': 'Olympique de Marseille',
+    'Olympique Lyonnais': 'Olympique Lyonnais',
+    'AS Monaco': 'AS Monaco',
+    'AS Monaco FC': 'AS Monaco',
+    'Lille OSC': 'Lille OSC',
+    'Lille': 'Lille OSC',
+    'FC Nantes': 'FC Nantes',
+    'Nantes': 'FC Nantes',
+    'Girondins de Bordeaux': 'FC Girondins de Bordeaux',
+    'FC Girondins de Bordeaux': 'FC Girondins de Bordeaux',
+    'AS Saint-Etienne': 'AS Saint-Etienne',
+    'Stade de Reims': 'Stade de Reims',
+    'OGC Nice': 'OGC Nice',
+    'Nice': 'OGC Nice',
+    'RC Lens': 'RC Lens',
+    'Lens': 'RC Lens',
+    'Montpellier': 'Montpellier',
+    'AJ Auxerre': 'AJ Auxerre',
+    'RC Strasbourg': 'RC Strasbourg',
+    'Strasbourg': 'RC Strasbourg',
+    
+    # Bundesliga
+    'Bayern Munich': 'Bayern Munich',
+    'Borussia Dortmund': 'Borussia Dortmund',
+    'RB Leipzig': 'RB Leipzig',
+    'Bayer Leverkusen': 'Bayer Leverkusen',
+    'Borussia Mönchengladbach': 'Borussia Mönchengladbach',
+    'Eintracht Frankfurt': 'Eintracht Frankfurt',
+    'VfL Wolfsburg': 'VfL Wolfsburg',
+    'FC Schalke 04': 'FC Schalke 04',
+    'Werder Bremen': 'Werder Bremen',
+    'Hamburger SV': 'Hamburger SV',
+    'VfB Stuttgart': 'VfB Stuttgart',
+    'Hertha Berlin': 'Hertha Berlin',
+    'TSG Hoffenheim': 'TSG Hoffenheim',
+    'FC Augsburg': 'FC Augsburg',
+    'SC Freiburg': 'SC Freiburg',
+    'Mainz 05': 'Mainz 05',
+    'FC Cologne': 'FC Cologne',
+    'Union Berlin': 'Union Berlin',
+    'Arminia Bielefeld': 'Arminia Bielefeld',
+    'Fortuna Düsseldorf': 'Fortuna Düsseldorf',
+    'Paderborn': 'Paderborn',
+    'Greuther Fürth': 'Greuther Fürth',
+    'Kaiserslautern': 'Kaiserslautern',
+    'Nürnberg': 'Nürnberg',
+    'Hamburg': 'Hamburger SV',
+    'Stuttgart': 'VfB Stuttgart',
+    'Köln': 'FC Cologne',
+    'Mönchengladbach': 'Borussia Mönchengladbach',
+    'Frankfurt': 'Eintracht Frankfurt',
+    'Dortmund': 'Borussia Dortmund',
+    'München': 'Bayern Munich',
+    'Leverkusen': 'Bayer Leverkusen',
+    'Wolfsburg': 'VfL Wolfsburg',
+    'Schalke': 'FC Schalke 04',
+    'Bremen': 'Werder Bremen',
+    'Hoffenheim': 'TSG Hoffenheim',
+    'Augsburg': 'FC Augsburg',
+    'Freiburg': 'SC Freiburg',
+    'Mainz': 'Mainz 05',
+    'Berlin': 'Hertha Berlin',
+    'Bielefeld': 'Arminia Bielefeld',
+    'Düsseldorf': 'Fortuna Düsseldorf',
+    'Fürth': 'Greuther Fürth',
+    
+    # Other clubs that might appear in Champions League
+    'Porto': 'FC Porto',
+    'Benfica': 'SL Benfica',
+    'Sporting CP': 'Sporting CP',
+    'Ajax': 'Ajax Amsterdam',
+    'PSV': 'PSV Eindhoven',
+    'Feyenoord': 'Feyenoord',
+    'Celtic': 'Celtic FC',
+    'Rangers': 'Rangers FC',
+    'Dynamo Kiev': 'Dynamo Kiev',
+    'Shakhtar Donetsk': 'Shakhtar Donetsk',
+    'Galatasaray': 'Galatasaray',
+    'Fenerbahce': 'Fenerbahce',
+    'Besiktas': 'Besiktas',
+    'Olympiakos': 'Olympiakos',
+    'Panathinaikos': 'Panathinaikos',
+    'Red Star Belgrade': 'Red Star Belgrade',
+    'Partizan': 'Partizan Belgrade',
+    'Steaua Bucureşti': 'Steaua Bucureşti',
+    'Dynamo Bucharest': 'Dynamo Bucharest',
+    'Marseille': 'Olympique de Marseille',
+    'Club Brugge': 'Club Brugge',
+    'Anderlecht': 'Anderlecht',
+    'Malmö FF': 'Malmö FF',
+    'Rosenborg': 'Rosenborg',
+    'CSKA Moscow': 'CSKA Moscow',
+    'Spartak Moscow': 'Spartak Moscow',
+    'Zenit St Petersburg': 'Zenit St Petersburg',
+    'Saint-Etienne': 'AS Saint-Etienne',
+    'Monaco': 'AS Monaco',
+    'FC Sete': 'FC Sete',
+    'FC Sochaux-Montbeliard': 'FC Sochaux-Montbeliard',
+    'Racing Club de Paris': 'Racing Club de Paris',
+    'Olympique Lillois': 'Olympique Lillois',
+    'CO Roubaix-Tourcoing': 'CO Roubaix-Tourcoing',
+    'Burnley Wolverhampton': 'Burnley FC',  # Possible data error
+}
+
+# Lowercased (key, club) pairs for the partial-match fallback in map_winner_to_club
+CLUB_ITEMS_LOWER = [(key.lower(), value) for key, value in CLUB_MAPPING.items()]
 
 
 def map_competition_to_league(competition):
     """Map competition names to league names matching transfer_spending_cleaned.csv."""
-    competition_mapping = {
-        'Champions League': 'Champions League',  # Keep as is
-        'English Premier League': 'Premier League',
-        'Spain La Liga': 'LaLiga',
-        'France Ligue 1': 'Ligue 1',
-        'Italy Serie A': 'Serie A',
-        'Germany Bundesliga': 'Bundesliga'
-    }
-    
-    return competition_mapping.get(competition, competition)
+    return COMPETITION_MAPPING.get(competition, competition)
 
 
 def convert_season_format(season):
@@ -31,13 +219,13 @@ def convert_season_format(season):
     season_str = str(season).strip()
     
     # Pattern for YYYY-YY format (e.g., "2024-25")
-    match = re.match(r'^(\d{4})-(\d{2})$', season_str)
+    match = SEASON_YYYY_YY.match(season_str)
     if match:
         year1, year2 = match.groups()
         return f"{year1[2:]}/{year2}"
     
     # Pattern for YYYY-Y format (e.g., "2008-9", "2007-8")
-    match = re.match(r'^(\d{4})-(\d{1})$', season_str)
+    match = SEASON_YYYY_Y.match(season_str)
     if match:
         year1, year2 = match.groups()
         # Convert single digit to two digits with leading zero
@@ -45,18 +233,18 @@ def convert_season_format(season):
         return f"{year1[2:]}/{year2_formatted}"
     
     # Pattern for YYYY-YYYY format (e.g., "2024-2025")
-    match = re.match(r'^(\d{4})-(\d{4})$', season_str)
+    match = SEASON_YYYY_YYYY.match(season_str)
     if match:
         year1, year2 = match.groups()
         return f"{year1[2:]}/{year2[2:]}"
     
     # Pattern for YY/YY format (already correct)
-    match = re.match(r'^(\d{2})/(\d{2})$', season_str)
+    match = SEASON_YY_YY.match(season_str)
     if match:
         return season_str
     
     # Pattern for single year (e.g., "2024")
-    match = re.match(r'^(\d{4})$', season_str)
+    match = SEASON_YYYY.match(season_str)
     if match:
         year = int(match.group(1))
         next_year = year + 1
@@ -72,7 +260,7 @@ def calculate_next_season(season):
         return ''
     
     # Pattern for YY/YY format
-    match = re.match(r'^(\d{2})/(\d{2})$', season)
+    match = SEASON_YY_YY.match(season)
     if match:
         year1, year2 = match.groups()
         next_year1 = int(year2)
@@ -82,6 +270,37 @@ def calculate_next_season(season):
     return ''
 
 
+def convert_season_column(seasons):
+    """Vectorized convert_season_format over a whole Season column."""
+    s = seasons.astype(str).str.strip()
+    
+    yyyy_yy = s.str.extract(SEASON_YYYY_YY)
+    yyyy_y = s.str.extract(SEASON_YYYY_Y)
+    yyyy_yyyy = s.str.extract(SEASON_YYYY_YYYY)
+    yyyy = s.str.extract(SEASON_YYYY)[0].dropna()
+    
+    from_yyyy_yy = yyyy_yy[0].str[2:] + '/' + yyyy_yy[1]
+    from_yyyy_y = yyyy_y[0].str[2:] + '/0' + yyyy_y[1]
+    from_yyyy_yyyy = yyyy_yyyy[0].str[2:] + '/' + yyyy_yyyy[1].str[2:]
+    from_yyyy = (yyyy.str[2:] + '/' + (yyyy.astype(int) + 1).astype(str).str[2:]).reindex(s.index)
+    
+    # YY/YY and unrecognised formats are kept as-is
+    converted = (from_yyyy_yy
+                 .combine_first(from_yyyy_y)
+                 .combine_first(from_yyyy_yyyy)
+                 .combine_first(from_yyyy)
+                 .fillna(s))
+    return converted.mask(seasons.isna() | (s == ''), '')
+
+
+def calculate_next_season_column(seasons):
+    """Vectorized calculate_next_season over a whole YY/YY season column."""
+    years = seasons.astype(str).str.extract(SEASON_YY_YY)[1].dropna()
+    next_seasons = years + '/' + ((years.astype(int) + 1) % 100).astype(str).str.zfill(2)
+    return next_seasons.reindex(seasons.index, fill_value='')
+
+
+@lru_cache(maxsize=None)
 def map_winner_to_club(winner):
     """Map winner names to club names matching transfer_spending_cleaned.csv."""
     if pd.isna(winner) or winner == '':
@@ -90,193 +309,14 @@ def map_winner_to_club(winner):
     # Clean up the winner name
     winner = winner.strip()
     
-    # Common club name mappings
-    club_mapping = {
-        # Premier League
-        'Manchester United': 'Manchester United',
-        'Manchester City': 'Manchester City',
-        'Liverpool': 'Liverpool FC',
-        'Chelsea': 'Chelsea FC',
-        'Arsenal': 'Arsenal FC',
-        'Tottenham Hotspur': 'Tottenham Hotspur',
-        'Aston Villa': 'Aston Villa',
-        'Everton': 'Everton FC',
-        'Leicester City': 'Leicester City',
-        'Brighton & Hove Albion': 'Brighton & Hove Albion',
-        'Newcastle United': 'Newcastle United',
-        'West Ham United': 'West Ham United',
-        'Burnley': 'Burnley FC',
-        'Leeds United': 'Leeds United',
-        'Nottingham Forest': 'Nottingham Forest',
-        'Blackburn Rovers': 'Blackburn Rovers',
-        'Sheffield Wednesday': 'Sheffield Wednesday',
-        'Sheffield United': 'Sheffield United',
-        'Wolverhampton Wanderers': 'Wolverhampton Wanderers',
-        'Huddersfield Town': 'Huddersfield Town',
-        'Ipswich Town': 'Ipswich Town',
-        'Derby County': 'Derby County',
-        'Sunderland': 'Sunderland',
-        'Preston North End': 'Preston North End',
-        'Portsmouth': 'Portsmouth',
-        'West Bromwich Albion': 'West Bromwich Albion',
-        
-        # LaLiga
-        'Real Madrid': 'Real Madrid',
-        'Barcelona': 'FC Barcelona',
-        'FC Barcelona': 'FC Barcelona',
-        'Atletico de Madrid': 'Atlético de Madrid',
-        'Atlético Madrid': 'Atlético de Madrid',
-        'Atlético de Madrid': 'Atlético de Madrid',
-        'Valencia': 'Valencia CF',
-        'Sevilla': 'Sevilla FC',
-        'Athletic Bilbao': 'Athletic Bilbao',
-        'Real Sociedad': 'Real Sociedad',
-        'Villarreal': 'Villarreal CF',
-        'Betis': 'Real Betis',
-        'Deportivo La Coruña': 'Deportivo La Coruña',
-        'Espanyol': 'RCD Espanyol',
-        
-        # Serie A
-        'Juventus': 'Juventus FC',
-        'Juventus FC': 'Juventus FC',
-        'Milan': 'AC Milan',
-        'AC Milan': 'AC Milan',
-        'Inter Milan': 'Inter Milan',
-        'Internazionale': 'Inter Milan',
-        'Napoli': 'SSC Napoli',
-        'SSC Napoli': 'SSC Napoli',
-        'Roma': 'AS Roma',
-        'AS Roma': 'AS Roma',
-        'Lazio': 'Lazio',
-        'Fiorentina': 'Fiorentina',
-        'Atalanta': 'Atalanta BC',
-        'Torino': 'Torino FC',
-        'Genoa': 'Genoa CFC',
-        'Sampdoria': 'Sampdoria',
-        'Bologna': 'Bologna FC',
-        'Cagliari': 'Cagliari',
-        'Hellas Verona': 'Hellas Verona',
-        'Parma': 'AC Parma',
-        
-        # Ligue 1
-        'Paris Saint-Germain': 'Paris Saint-Germain',
-        'Paris Saint-Germain FC': 'Paris Saint-Germain',
-        'Olympique de Marseille': 'Olympique de Marseille',
-        'Olympique Lyonnais': 'Olympique Lyonnais',
-        'AS Monaco': 'AS Monaco',
-        'AS Monaco FC': 'AS Monaco',
-        'Lille OSC': 'Lille OSC',
-        'Lille': 'Lille OSC',
-        'FC Nantes': 'FC Nantes',
-        'Nantes': 'FC Nantes',
-        'Girondins de Bordeaux': 'FC Girondins de Bordeaux',
-        'FC Girondins de Bordeaux': 'FC Girondins de Bordeaux',
-        'AS Saint-Etienne': 'AS Saint-Etienne',
-        'Stade de Reims': 'Stade de Reims',
-        'OGC Nice': 'OGC Nice',
-        'Nice': 'OGC Nice',
-        'RC Lens': 'RC Lens',
-        'Lens': 'RC Lens',
-        'Montpellier': 'Montpellier',
-        'AJ Auxerre': 'AJ Auxerre',
-        'RC Strasbourg': 'RC Strasbourg',
-        'Strasbourg': 'RC Strasbourg',
-        
-        # Bundesliga
-        'Bayern Munich': 'Bayern Munich',
-        'Borussia Dortmund': 'Borussia Dortmund',
-        'RB Leipzig': 'RB Leipzig',
-        'Bayer Leverkusen': 'Bayer Leverkusen',
-        'Borussia Mönchengladbach': 'Borussia Mönchengladbach',
-        'Eintracht Frankfurt': 'Eintracht Frankfurt',
-        'VfL Wolfsburg': 'VfL Wolfsburg',
-        'FC Schalke 04': 'FC Schalke 04',
-        'Werder Bremen': 'Werder Bremen',
-        'Hamburger SV': 'Hamburger SV',
-        'VfB Stuttgart': 'VfB Stuttgart',
-        'Hertha Berlin': 'Hertha Berlin',
-        'TSG Hoffenheim': 'TSG Hoffenheim',
-        'FC Augsburg': 'FC Augsburg',
-        'SC Freiburg': 'SC Freiburg',
-        'Mainz 05': 'Mainz 05',
-        'FC Cologne': 'FC Cologne',
-        'Union Berlin': 'Union Berlin',
-        'Arminia Bielefeld': 'Arminia Bielefeld',
-        'Fortuna Düsseldorf': 'Fortuna Düsseldorf',
-        'Paderborn': 'Paderborn',
-        'Greuther Fürth': 'Greuther Fürth',
-        'Kaiserslautern': 'Kaiserslautern',
-        'Nürnberg': 'Nürnberg',
-        'Hamburg': 'Hamburger SV',
-        'Kaiserslautern': 'Kaiserslautern',
-        'Stuttgart': 'VfB Stuttgart',
-        'Köln': 'FC Cologne',
-        'Mönchengladbach': 'Borussia Mönchengladbach',
-        'Frankfurt': 'Eintracht Frankfurt',
-        'Dortmund': 'Borussia Dortmund',
-        'München': 'Bayern Munich',
-        'Leverkusen': 'Bayer Leverkusen',
-        'Wolfsburg': 'VfL Wolfsburg',
-        'Schalke': 'FC Schalke 04',
-        'Bremen': 'Werder Bremen',
-        'Hoffenheim': 'TSG Hoffenheim',
-        'Augsburg': 'FC Augsburg',
-        'Freiburg': 'SC Freiburg',
-        'Mainz': 'Mainz 05',
-        'Berlin': 'Hertha Berlin',
-        'Bielefeld': 'Arminia Bielefeld',
-        'Düsseldorf': 'Fortuna Düsseldorf',
-        'Fürth': 'Greuther Fürth',
-        'Nürnberg': 'Nürnberg',
-        
-        # Other clubs that might appear in Champions League
-        'Porto': 'FC Porto',
-        'Benfica': 'SL Benfica',
-        'Sporting CP': 'Sporting CP',
-        'Ajax': 'Ajax Amsterdam',
-        'PSV': 'PSV Eindhoven',
-        'Feyenoord': 'Feyenoord',
-        'Celtic': 'Celtic FC',
-        'Rangers': 'Rangers FC',
-        'Dynamo Kiev': 'Dynamo Kiev',
-        'Shakhtar Donetsk': 'Shakhtar Donetsk',
-        'Galatasaray': 'Galatasaray',
-        'Fenerbahce': 'Fenerbahce',
-        'Besiktas': 'Besiktas',
-        'Olympiakos': 'Olympiakos',
-        'Panathinaikos': 'Panathinaikos',
-        'Red Star Belgrade': 'Red Star Belgrade',
-        'Partizan': 'Partizan Belgrade',
-        'Steaua Bucureşti': 'Steaua Bucureşti',
-        'Dynamo Bucharest': 'Dynamo Bucharest',
-        'Marseille': 'Olympique de Marseille',
-        'Club Brugge': 'Club Brugge',
-        'Anderlecht': 'Anderlecht',
-        'Malmö FF': 'Malmö FF',
-        'Rosenborg': 'Rosenborg',
-        'CSKA Moscow': 'CSKA Moscow',
-        'Spartak Moscow': 'Spartak Moscow',
-        'Zenit St Petersburg': 'Zenit St Petersburg',
-        'Borussia Mönchengladbach': 'Borussia Mönchengladbach',
-        'Saint-Etienne': 'AS Saint-Etienne',
-        'Leeds United': 'Leeds United',
-        'Monaco': 'AS Monaco',
-        'Stade de Reims': 'Stade de Reims',
-        'FC Sete': 'FC Sete',
-        'FC Sochaux-Montbeliard': 'FC Sochaux-Montbeliard',
-        'Racing Club de Paris': 'Racing Club de Paris',
-        'Olympique Lillois': 'Olympique Lillois',
-        'CO Roubaix-Tourcoing': 'CO Roubaix-Tourcoing',
-        'Burnley Wolverhampton': 'Burnley FC',  # Possible data error
-    }
-    
     # Try exact match first
-    if winner in club_mapping:
-        return club_mapping[winner]
+    if winner in CLUB_MAPPING:
+        return CLUB_MAPPING[winner]
     
     # Try partial matches for some common variations
-    for key, value in club_mapping.items():
-        if key.lower() in winner.lower() or winner.lower() in key.lower():
+    winner_lower = winner.lower()
+    for key_lower, value in CLUB_ITEMS_LOWER:
+        if key_lower in winner_lower or winner_lower in key_lower:
             return value
     
     # If no mapping found, return the original name
@@ -292,7 +332,9 @@ def main():
     
     # Load the data
     print("Loading winners_combined.csv...")
-    df = pd.read_csv(input_file)
+    winner_columns = ['Competition', 'Season', 'Winner', 'Runner_up', 'Score']
+    df = pd.read_csv(input_file, usecols=winner_columns,
+                     dtype=dict.fromkeys(winner_columns, 'string'))
     
     print(f"Original data shape: {df.shape}")
     print(f"Original columns: {list(df.columns)}")
@@ -302,19 +344,22 @@ def main():
     
     # 1. Map Competition to League
     print("  - Mapping Competition to League...")
-    df['League'] = df['Competition'].apply(map_competition_to_league)
+    df['League'] = df['Competition'].map(COMPETITION_MAPPING).fillna(df['Competition'])
     
     # 2. Convert Season format
     print("  - Converting Season format...")
-    df['Winning Season'] = df['Season'].apply(convert_season_format)
+    df['Winning Season'] = convert_season_column(df['Season'])
     
     # 3. Calculate Next Season
     print("  - Calculating Next Season...")
-    df['Next Season'] = df['Winning Season'].apply(calculate_next_season)
+    df['Next Season'] = calculate_next_season_column(df['Winning Season'])
     
     # 4. Map Winner to Club
     print("  - Mapping Winner to Club...")
-    df['Club'] = df['Winner'].apply(map_winner_to_club)
+    # Exact matches in one vectorized lookup; only the rest take the partial-match path
+    df['Club'] = df['Winner'].str.strip().map(CLUB_MAPPING)
+    unmatched = df['Club'].isna()
+    df.loc[unmatched, 'Club'] = df.loc[unmatched, 'Winner'].apply(map_winner_to_club)
     
     # Select and reorder columns
     final_columns = [
@@ -2,6 +2,7 @@
 import pandas as pd
 import matplotlib.pyplot as plt
 import numpy as np
+from spending_data import load_transfer_spending
 
 # Set matplotlib to use non-interactive backend
 plt.switch_backend('Agg')
@@ -9,16 +10,12 @@ plt.switch_backend('Agg')
 def create_ranking_based_histogram():
     """Create a histogram showing expenditure by season with ranking bins (top 10, top 25, top 50, top 100, top 200)"""
     
-    # Read the cleaned CSV file
-    df = pd.read_csv('/Users/eugine_kang/Documents/hobby/Unnecessary Analysis/transfer_spending/data/transfer_spending_cleaned.csv')
-    
-    # Convert Expenditure to numeric, removing 'm' suffix and handling any non-numeric values
-    df['Expenditure'] = df['Expenditure'].astype(str).str.replace('m', '').str.replace('€', '').str.replace(',', '')
-    df['Expenditure'] = pd.to_numeric(df['Expenditure'], errors='coerce')
-    df['Expenditure'] = df['Expenditure'].fillna(0)
+    # Read the cleaned data with Expenditure already numeric
+    df = load_transfer_spending()
     
     # Filter out rows with missing ranks, expenditure, or seasons
     df_clean = df[(df['Rank'].notna()) & (df['Expenditure'] > 0) & (df['Season'].notna()) & (df['Season'] != '')]
+    df_clean = df_clean.astype({'Rank': np.int16})  # Ranks never exceed a few hundred
     
     # Define ranking bins
     ranking_bins = [
@@ -35,40 +32,40 @@ def create_ranking_based_histogram():
     # Define colors for each ranking bin
     colors = ['#FF6B35', '#38003c', '#0066CC', '#D20515', '#1f4788']
     
-    # Create data structure for stacked bar chart
-    bin_data = {}
-    bin_labels = []
-    
-    for i, (start_rank, end_rank, label) in enumerate(ranking_bins):
-        bin_labels.append(label)
-        bin_data[label] = []
-        
-        for season in seasons:
-            # Filter data for this season and ranking bin
-            season_bin_df = df_clean[
-                (df_clean['Season'] == season) & 
-                (df_clean['Rank'] >= start_rank) & 
-                (df_clean['Rank'] <= end_rank)
-            ]
-            total_expenditure = season_bin_df['Expenditure'].sum()
-            bin_data[label].append(total_expenditure)
+    # Create data structure for stacked bar chart: a (bins, seasons) matrix of
+    # summed expenditure, filled in one scatter-add over all rows
+    bin_labels = [label for _, _, label in ranking_bins]
+    bin_ends = np.array([end_rank for _, end_rank, _ in ranking_bins])
+    ranks = df_clean['Rank'].to_numpy()
+    
+    # Bin i covers ranks (bin_ends[i-1], bin_ends[i]]; ranks outside every bin are dropped
+    bin_idx = np.searchsorted(bin_ends, ranks, side='left')
+    season_idx = pd.Index(seasons).get_indexer(df_clean['Season'])
+    in_bins = (ranks >= ranking_bins[0][0]) & (bin_idx < len(bin_labels))
+    
+    bin_matrix = np.zeros((len(bin_labels), len(seasons)), dtype=np.float32)
+    np.add.at(bin_matrix, (bin_idx[in_bins], season_idx[in_bins]),
+              df_clean['Expenditure'].to_numpy()[in_bins])
+    
+    # Each bar's bottom is the running sum of the bins below it
+    bottoms = np.zeros_like(bin_matrix)
+    np.cumsum(bin_matrix[:-1], axis=0, out=bottoms[1:])
+    totals = bin_matrix.sum(axis=0)
+    bin_data = dict(zip(bin_labels, bin_matrix))
     
     # Create the stacked bar chart
     plt.figure(figsize=(16, 10))
     
     # Create stacked bars
-    bottom = np.zeros(len(seasons))
     bars = []
     
     for i, label in enumerate(bin_labels):
-        bars.append(plt.bar(seasons, bin_data[label], bottom=bottom, 
+        bars.append(plt.bar(seasons, bin_matrix[i], bottom=bottoms[i], 
                            color=colors[i], label=label, alpha=0.8, 
-                           edgecolor='white', linewidth=0.5))
-        bottom += np.array(bin_data[label])
+                           edgecolor='white', linewidth=0.5, rasterized=True))
     
     # Add total expenditure labels on top of bars
-    for i, season in enumerate(seasons):
-        total = sum(bin_data[label][i] for label in bin_labels)
+    for i, total in enumerate(totals):
         if total > 0:
             plt.text(i, total + total * 0.01, f'€{total:,.0f}M', 
                     ha='center', va='bottom', fontweight='bold', fontsize=9)
@@ -88,7 +85,7 @@ def create_ranking_based_histogram():
     # Add annotation for Real Madrid in 09/10 season
     season_idx = seasons.index('09/10')
     # Find the y-position for the Top 11-25 bin in 09/10 season (top of the bin)
-    y_position = bin_data['Top 10'][season_idx] + bin_data['Top 11-25'][season_idx]
+    y_position = bottoms[bin_labels.index('Top 26-50'), season_idx]
     
     # Add arrow annotation (pointing down from above)
     plt.annotate('Real Madrid\n09/10 Season\n(Rank 17)\n€258.5M', 
@@ -104,34 +101,24 @@ def create_ranking_based_histogram():
     
     # Save the plot
     output_path = '/Users/eugine_kang/Documents/hobby/Unnecessary Analysis/transfer_spending/plots/ranking_based_histogram.png'
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
+    # 150 dpi is plenty on screen; layout is already tight, so skip the bbox probe render
+    plt.savefig(output_path, dpi=150)
     
     print(f"\nRanking-based histogram saved to: {output_path}")
     
     # Print statistics by season
     print("\nExpenditure Analysis by Season and Ranking Bins:")
     print("-" * 100)
-    print(f"{'Season':<10} {'Top 10':<10} {'Top 11-25':<10} {'Top 26-50':<10} {'Top 51-100':<11} {'Top 101-200':<11} {'Total':<10}")
-    print("-" * 100)
-    
-    for i, season in enumerate(seasons):
-        row = f"{season:<10} "
-        total_season = 0
-        for label in bin_labels:
-            value = bin_data[label][i]
-            row += f"€{value:<9,.0f} "
-            total_season += value
-        row += f"€{total_season:<9,.0f}"
-        print(row)
-    
+    summary = pd.DataFrame(bin_matrix.T, index=pd.Index(seasons, name='Season'), columns=bin_labels)
+    summary['Total'] = totals
+    print(summary.to_string(float_format='€{:,.0f}'.format))
     print("-" * 100)
     
     # Print totals by ranking bin
     print("\nTotal Expenditure by Ranking Bin (all seasons):")
     print("-" * 50)
-    for label in bin_labels:
-        total = sum(bin_data[label])
-        print(f"{label}: €{total:,.0f}M")
+    bin_totals = pd.Series(bin_matrix.sum(axis=1), index=bin_labels)
+    print(bin_totals.to_string(float_format='€{:,.0f}M'.format))
     
     return bin_data, seasons
 
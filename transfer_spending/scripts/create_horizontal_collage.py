@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 
 import os
+import numpy as np
 from PIL import Image
 
 def create_horizontal_collage():
@@ -10,19 +11,15 @@ def create_horizontal_collage():
     images_dir = "../images"
     output_path = "../plots/real_madrid_players_collage.jpg"
     
-    # Get all image files
-    image_files = []
-    for filename in os.listdir(images_dir):
-        if filename.lower().endswith(('.jpg', '.jpeg', '.png')):
-            image_files.append(os.path.join(images_dir, filename))
+    # Get all image files, sorted for consistent ordering
+    with os.scandir(images_dir) as entries:
+        image_files = sorted(entry.path for entry in entries
+                             if entry.is_file() and entry.name.lower().endswith(('.jpg', '.jpeg', '.png')))
     
     if not image_files:
         print("No image files found in the images directory")
         return
     
-    # Sort files for consistent ordering
-    image_files.sort()
-    
     # Load and resize images to same height
     images = []
     target_height = 400  # Standard height for all images
@@ -34,8 +31,12 @@ def create_horizontal_collage():
             aspect_ratio = img.width / img.height
             target_width = int(target_height * aspect_ratio)
             
-            # Resize image
-            img_resized = img.resize((target_width, target_height), Image.Resampling.LANCZOS)
+            # For JPEGs, let libjpeg decode at a reduced scale (still >= 2x target)
+            if img.format == 'JPEG':
+                img.draft('RGB', (target_width * 2, target_height * 2))
+            
+            # Resize image (bilinear is enough after the draft downscale)
+            img_resized = img.resize((target_width, target_height), Image.Resampling.BILINEAR)
             images.append(img_resized)
             print(f"Loaded: {os.path.basename(img_path)}")
             
@@ -49,20 +50,20 @@ def create_horizontal_collage():
     # Calculate total width
     total_width = sum(img.width for img in images)
     
-    # Create collage
-    collage = Image.new('RGB', (total_width, target_height), 'white')
-    
-    # Paste images horizontally
+    # Copy images side by side into one preallocated RGB buffer
+    buffer = np.empty((target_height, total_width, 3), dtype=np.uint8)
     x_offset = 0
     for img in images:
-        collage.paste(img, (x_offset, 0))
+        buffer[:, x_offset:x_offset + img.width] = np.asarray(img.convert('RGB'))
         x_offset += img.width
     
+    collage = Image.fromarray(buffer, 'RGB')
+    
     # Ensure output directory exists
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
     
     # Save collage
-    collage.save(output_path, quality=95)
+    collage.save(output_path, 'JPEG', quality=85, optimize=True, progressive=True, subsampling=2)
     print(f"Horizontal collage saved to: {output_path}")
     print(f"Final dimensions: {collage.width}x{collage.height}")
 
@@ -10,10 +10,26 @@ from PIL import Image, ImageDraw, ImageFont
 import urllib.parse
 from io import BytesIO
 import time
+from concurrent.futures import ThreadPoolExecutor
 
-def search_and_download_player_image(player_name, images_dir):
+# Shared session so concurrent downloads reuse pooled keep-alive connections
+SESSION = requests.Session()
+SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+})
+
+# Fonts are parsed once at import and shared by the placeholder and collage helpers
+try:
+    PLACEHOLDER_FONT = ImageFont.truetype("/System/Library/Fonts/Arial.ttf", 24)
+    NAME_FONT = ImageFont.truetype("/System/Library/Fonts/Arial.ttf", 20)
+except OSError:
+    PLACEHOLDER_FONT = NAME_FONT = ImageFont.load_default()
+
+def search_and_download_player_image(player_name, images_dir, session=SESSION):
     """
     Download player image from predefined high-quality sources
+    
+    Returns (filepath, image) so callers can reuse the decoded image
     """
     # Create a safe filename
     safe_name = "".join(c for c in player_name if c.isalnum() or c in (' ', '-', '_')).rstrip()
@@ -24,7 +40,9 @@ def search_and_download_player_image(player_name, images_dir):
     # Check if image already exists
     if os.path.exists(filepath):
         print(f"Using existing image for {player_name}")
-        return filepath
+        img = Image.open(filepath)
+        img.load()
+        return filepath, img
     
     # Predefined image URLs for the players (using Wikipedia commons)
     player_images = {
@@ -40,36 +58,35 @@ def search_and_download_player_image(player_name, images_dir):
             print(f"Downloading image for {player_name} from Wikipedia...")
             
             # Download the image
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-            response = requests.get(url, headers=headers, timeout=15)
+            response = session.get(url, timeout=15)
             response.raise_for_status()
             
             # Open and process the image
             img = Image.open(BytesIO(response.content))
             
+            # For JPEGs, let libjpeg decode at a reduced scale (still >= 2x target)
+            if img.format == 'JPEG':
+                img.draft('RGB', (600, 800))
+            
             # Convert to RGB if necessary
             if img.mode != 'RGB':
                 img = img.convert('RGB')
             
             # Resize image to standard size
-            img = img.resize((300, 400), Image.Resampling.LANCZOS)
+            img = img.resize((300, 400), Image.Resampling.BILINEAR)
             
             # Save the image
             img.save(filepath, 'JPEG', quality=85)
             print(f"Successfully downloaded and saved image for {player_name}")
-            return filepath
+            return filepath, img
         else:
             print(f"No predefined image URL for {player_name}, creating placeholder")
-            create_placeholder_image(player_name, filepath)
-            return filepath
+            return filepath, create_placeholder_image(player_name, filepath)
             
     except Exception as e:
         print(f"Error downloading image for {player_name}: {e}")
         # Create placeholder as fallback
-        create_placeholder_image(player_name, filepath)
-        return filepath
+        return filepath, create_placeholder_image(player_name, filepath)
 
 def create_placeholder_image(player_name, filepath):
     """
@@ -77,11 +94,7 @@ def create_placeholder_image(player_name, filepath):
     """
     img = Image.new('RGB', (300, 400), color='lightblue')
     draw = ImageDraw.Draw(img)
-    
-    try:
-        font = ImageFont.truetype("/System/Library/Fonts/Arial.ttf", 24)
-    except:
-        font = ImageFont.load_default()
+    font = PLACEHOLDER_FONT
     
     text = f"Photo of\n{player_name}"
     bbox = draw.textbbox((0, 0), text, font=font)
@@ -94,16 +107,17 @@ def create_placeholder_image(player_name, filepath):
     
     img.save(filepath)
     print(f"Created placeholder image for {player_name}")
+    return img
 
 def create_collage(player_names, images_dir, output_path):
     """
     Create a collage of player images with names below
     """
-    # Download images for all players
-    image_paths = []
-    for player in player_names:
-        img_path = search_and_download_player_image(player, images_dir)
-        image_paths.append((img_path, player))
+    # Download images for all players concurrently (network-bound)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        downloaded = executor.map(lambda player: search_and_download_player_image(player, images_dir),
+                                  player_names)
+        image_paths = list(zip(downloaded, player_names))
     
     # Create collage layout (2x2 grid for 4 players)
     img_width, img_height = 300, 400
@@ -117,14 +131,11 @@ def create_collage(player_names, images_dir, output_path):
     # Create blank collage canvas
     collage = Image.new('RGB', (collage_width, collage_height), 'white')
     
-    # Load font for names
-    try:
-        name_font = ImageFont.truetype("/System/Library/Fonts/Arial.ttf", 20)
-    except:
-        name_font = ImageFont.load_default()
+    name_font = NAME_FONT
+    draw = ImageDraw.Draw(collage)
     
     # Place images and names in grid
-    for i, (img_path, player_name) in enumerate(image_paths):
+    for i, ((img_path, img), player_name) in enumerate(image_paths):
         row = i // cols
         col = i % cols
         
@@ -132,13 +143,12 @@ def create_collage(player_names, images_dir, output_path):
         x = col * img_width
         y = row * (img_height + text_height)
         
-        # Open and resize image
-        with Image.open(img_path) as img:
+        # Reuse the already-decoded image; resize only if it isn't cell-sized
+        if img.size != (img_width, img_height):
             img = img.resize((img_width, img_height))
-            collage.paste(img, (x, y))
+        collage.paste(img, (x, y))
         
         # Add player name below image
-        draw = ImageDraw.Draw(collage)
         name_bbox = draw.textbbox((0, 0), player_name, font=name_font)
         name_width = name_bbox[2] - name_bbox[0]
         name_x = x + (img_width - name_width) // 2
@@ -147,7 +157,7 @@ def create_collage(player_names, images_dir, output_path):
         draw.text((name_x, name_y), player_name, fill='black', font=name_font)
     
     # Save collage
-    collage.save(output_path)
+    collage.save(output_path, 'JPEG', quality=85, optimize=True, progressive=True, subsampling=2)
     print(f"Collage saved to {output_path}")
     return output_path
 
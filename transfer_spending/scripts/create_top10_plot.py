@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
-import pandas as pd
 import matplotlib.pyplot as plt
 import numpy as np
+from spending_data import load_transfer_spending
 
 # Set matplotlib to use non-interactive backend
 plt.switch_backend('Agg')
@@ -9,19 +9,14 @@ plt.switch_backend('Agg')
 def create_top10_expenditure_plot():
     """Create a plot showing the top 10 expenditure for club and season"""
     
-    # Read the cleaned CSV file
-    df = pd.read_csv('/Users/eugine_kang/Documents/hobby/Unnecessary Analysis/transfer_spending/data/transfer_spending_cleaned.csv')
-    
-    # Convert Expenditure to numeric, removing 'm' suffix and handling any non-numeric values
-    df['Expenditure'] = df['Expenditure'].astype(str).str.replace('m', '').str.replace('€', '').str.replace(',', '')
-    df['Expenditure'] = pd.to_numeric(df['Expenditure'], errors='coerce')
-    df['Expenditure'] = df['Expenditure'].fillna(0)
+    # Read the cleaned data with Expenditure already numeric
+    df = load_transfer_spending()
     
     # Filter out rows with missing data
     df_clean = df[(df['Expenditure'] > 0) & (df['Club'].notna()) & (df['Season'].notna()) & (df['Season'] != '')]
     
-    # Get top 10 expenditures (reverse order so highest is on top)
-    top10 = df_clean.nlargest(10, 'Expenditure').iloc[::-1]
+    # Get top 10 expenditures (ascending so highest is on top of the barh)
+    top10 = df_clean.nlargest(10, 'Expenditure').sort_values('Expenditure', kind='stable')
     
     # Create club-season labels
     top10['Club_Season'] = top10['Club'] + '\n' + top10['Season']
@@ -38,18 +33,16 @@ def create_top10_expenditure_plot():
     }
     
     # Map colors to bars based on club (Liverpool gets red, others by league)
-    bar_colors = []
-    for _, row in top10.iterrows():
-        if 'Liverpool' in row['Club']:
-            bar_colors.append('#FF0000')  # Red for Liverpool
-        else:
-            bar_colors.append(league_colors.get(row['League'], league_colors['Others']))
+    bar_colors = (top10['League'].map(league_colors)
+                  .fillna(league_colors['Others'])
+                  .mask(top10['Club'].str.contains('Liverpool', regex=False, na=False), '#FF0000')  # Red for Liverpool
+                  .to_numpy())
     
     # Create the plot
     plt.figure(figsize=(16, 10))
     
     # Create horizontal bar chart
-    bars = plt.barh(range(len(top10)), top10['Expenditure'], color=bar_colors, alpha=0.8, edgecolor='black', linewidth=1)
+    bars = plt.barh(range(len(top10)), top10['Expenditure'], color=bar_colors, alpha=0.8, edgecolor='black', linewidth=1, rasterized=True)
     
     # Add value labels on bars
     for i, (bar, value) in enumerate(zip(bars, top10['Expenditure'])):
@@ -90,7 +83,8 @@ def create_top10_expenditure_plot():
     
     # Save the plot
     output_path = '/Users/eugine_kang/Documents/hobby/Unnecessary Analysis/transfer_spending/plots/top10_expenditure.png'
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
+    # 150 dpi is plenty on screen; layout is already tight, so skip the bbox probe render
+    plt.savefig(output_path, dpi=150)
     
     print(f"\nTop 10 expenditure plot saved to: {output_path}")
     
@@ -108,7 +102,7 @@ def create_top10_expenditure_plot():
     # Additional statistics
     print(f"\nTotal expenditure (Top 10): €{top10['Expenditure'].sum():,.1f}M")
     print(f"Average expenditure (Top 10): €{top10['Expenditure'].mean():,.1f}M")
-    print(f"Highest expenditure: {top10.iloc[0]['Club']} ({top10.iloc[0]['Season']}) - €{top10.iloc[0]['Expenditure']:,.1f}M")
+    print(f"Highest expenditure: {top10.iloc[-1]['Club']} ({top10.iloc[-1]['Season']}) - €{top10.iloc[-1]['Expenditure']:,.1f}M")
     
     # League breakdown
     print("\nLeague breakdown (Top 10):")
@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 """
-Script to download the first image from a web search using bing-image-downloader.
+Script to download the first image from a Bing Images web search.
 Searches Bing Images for the provided query and downloads the first result.
 
 Usage:
@@ -8,13 +8,33 @@ Usage:
     python download_web_image.py "09/10 Real Madrid Christiano Ronaldo"
 """
 
-import os
 import sys
 import argparse
-import shutil
+import html
+import os
+import tempfile
 from pathlib import Path
 import re
-from bing_image_downloader import downloader
+import requests
+
+BING_IMAGE_SEARCH_URL = 'https://www.bing.com/images/search'
+
+# Full-size image URLs ("murl") embedded in Bing's result page metadata
+MEDIA_URL_PATTERN = re.compile(r'murl&quot;:&quot;(.*?)&quot;')
+
+# Filename sanitizing patterns, see sanitize_filename
+SLASH_PATTERN = re.compile(r'[/\\]')
+INVALID_CHARS_PATTERN = re.compile(r'[<>:"|?*]')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+UNDERSCORES_PATTERN = re.compile(r'_+')
+
+# Number of result URLs to try before giving up
+MAX_CANDIDATES = 5
+
+SESSION = requests.Session()
+SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+})
 
 
 def sanitize_filename(query):
@@ -31,10 +51,10 @@ def sanitize_filename(query):
     filename = query.lower()
     
     # Replace problematic characters
-    filename = re.sub(r'[/\\]', '-', filename)  # Replace slashes with hyphens
-    filename = re.sub(r'[<>:"|?*]', '', filename)  # Remove other problematic chars
-    filename = re.sub(r'\s+', '_', filename)  # Replace spaces with underscores
-    filename = re.sub(r'_+', '_', filename)  # Replace multiple underscores with single
+    filename = SLASH_PATTERN.sub('-', filename)  # Replace slashes with hyphens
+    filename = INVALID_CHARS_PATTERN.sub('', filename)  # Remove other problematic chars
+    filename = WHITESPACE_PATTERN.sub('_', filename)  # Replace spaces with underscores
+    filename = UNDERSCORES_PATTERN.sub('_', filename)  # Replace multiple underscores with single
     filename = filename.strip('_-')  # Remove leading/trailing underscores and hyphens
     
     # Ensure it's not too long
@@ -44,6 +64,24 @@ def sanitize_filename(query):
     return filename
 
 
+def search_image_urls(query, session=SESSION):
+    """
+    Search Bing Images and return the full-size image URLs in result order.
+    
+    Args:
+        query (str): Search query
+        session (requests.Session): Session to issue the search with
+        
+    Returns:
+        list: Image URLs, first result first
+    """
+    response = session.get(BING_IMAGE_SEARCH_URL,
+                           params={'q': query, 'form': 'HDRSC2', 'adlt': 'off'},
+                           timeout=30)
+    response.raise_for_status()
+    return [html.unescape(url) for url in MEDIA_URL_PATTERN.findall(response.text)]
+
+
 def download_first_image(query, output_dir="../images/", custom_filename=None):
     """
     Download the first image from Bing search results.
@@ -74,100 +112,51 @@ def download_first_image(query, output_dir="../images/", custom_filename=None):
     print(f"Will save as: {final_filename}")
     print(f"Output directory: {output_path}")
     
-    # Create a temporary directory for bing-image-downloader
-    temp_download_dir = Path("./temp_downloads").resolve()
-    temp_download_dir.mkdir(exist_ok=True)
+    target_path = output_path / final_filename
     
     try:
-        # Use bing-image-downloader to search and download
         print("Searching Bing Images...")
+        image_urls = search_image_urls(query)
         
-        # Change to temp directory to control where downloads go
-        original_cwd = os.getcwd()
-        os.chdir(temp_download_dir)
-        
-        # Download images (limit to 1 to get just the first image)
-        downloader.download(query, limit=1, output_dir='.', 
-                          adult_filter_off=True, force_replace=False, timeout=30)
-        
-        # Change back to original directory
-        os.chdir(original_cwd)
-        
-        # bing-image-downloader creates: temp_downloads/query/query/image.jpg
-        # But we need to handle the exact folder name it creates
-        print("Looking for downloaded images...")
-        
-        # Find the folder that was actually created (it uses the exact query as folder name)
-        query_base_folder = None
-        for item in temp_download_dir.iterdir():
-            if item.is_dir() and item.name.strip().lower() == query.strip().lower():
-                query_base_folder = item
-                break
-        
-        if not query_base_folder:
-            # If exact match not found, try to find any folder (in case of encoding issues)
-            folders = [item for item in temp_download_dir.iterdir() if item.is_dir()]
-            if folders:
-                query_base_folder = folders[0]  # Use the first/only folder created
-                print(f"Using folder: {query_base_folder.name}")
-        
-        if not query_base_folder:
-            print(f"No download folder found in: {temp_download_dir}")
-            print("Available items:", list(temp_download_dir.iterdir()))
-            return False
-        
-        # Look for the nested folder inside (bing-image-downloader creates nested structure)
-        query_images_folder = None
-        for item in query_base_folder.iterdir():
-            if item.is_dir():
-                query_images_folder = item
-                break
-        
-        if not query_images_folder:
-            # Sometimes images are directly in the base folder
-            query_images_folder = query_base_folder
-        
-        print(f"Searching for images in: {query_images_folder}")
-        
-        # Find image files
-        image_files = []
-        valid_extensions = {'.jpg', '.jpeg', '.png', '.gif', '.webp', '.bmp', '.tiff'}
-        
-        for file_path in query_images_folder.rglob("*"):
-            if file_path.is_file() and file_path.suffix.lower() in valid_extensions:
-                image_files.append(file_path)
-        
-        if not image_files:
-            print("No image files found in download folder")
-            print("Folder contents:", list(query_images_folder.iterdir()))
+        if not image_urls:
+            print("No image results found")
             return False
         
-        # Get the first image
-        first_image = image_files[0]
-        print(f"Found image: {first_image}")
-        
-        # Copy to target location with desired filename
-        target_path = output_path / final_filename
-        shutil.copy2(first_image, target_path)
-        
-        print(f"Image saved to: {target_path}")
-        print(f"File size: {target_path.stat().st_size} bytes")
-        
-        return True
+        # Stream the first result that is really an image to a temp file in the
+        # output directory, and only move it into place once it is complete
+        for url in image_urls[:MAX_CANDIDATES]:
+            print(f"Found image: {url}")
+            fd, tmp_path = tempfile.mkstemp(suffix='.part', dir=output_path)
+            try:
+                with os.fdopen(fd, 'wb') as f, SESSION.get(url, stream=True, timeout=30) as response:
+                    response.raise_for_status()
+                    content_type = response.headers.get('Content-Type', '')
+                    if not content_type.startswith('image/'):
+                        print(f"Skipping {url}: not an image ({content_type or 'no Content-Type'})")
+                        continue
+                    # iter_content decodes gzip and reports dropped streams as RequestException
+                    for chunk in response.iter_content(chunk_size=1024 * 1024):
+                        f.write(chunk)
+                os.replace(tmp_path, target_path)
+            except (requests.RequestException, OSError) as e:
+                print(f"Could not download {url}: {e}")
+                continue
+            finally:
+                # Leftover when the candidate was skipped or failed partway
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+            
+            print(f"Image saved to: {target_path}")
+            print(f"File size: {target_path.stat().st_size} bytes")
+            return True
+        
+        print("None of the image results could be downloaded")
+        return False
         
     except Exception as e:
         print(f"Error downloading image: {e}")
         print(f"Error type: {type(e).__name__}")
         return False
-        
-    finally:
-        # Clean up temporary directory
-        if temp_download_dir.exists():
-            try:
-                shutil.rmtree(temp_download_dir)
-                print("Cleaned up temporary files")
-            except Exception as e:
-                print(f"Warning: Could not clean up temp directory: {e}")
 
 
 def main():
@@ -1,91 +1,90 @@
 #!/usr/bin/env python3
+import itertools
+import csv
 import os
 import re
-import csv
-from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor
+import lxml.html
+import pandas as pd
+
+# Monetary value (with sign if present), compiled once
+MONETARY_PATTERN = re.compile(r'€([-+]?[\d,]+\.?\d*[km]?)')
+
+# Column order of the extracted row tuples and the output CSV
+FIELDNAMES = ['Rank', 'Club', 'Competition', 'Expenditure', 'Arrivals', 'Income', 'Departures', 'Balance']
+
+# Columns holding values like '€630.25m' or '€-562.39m'
+MONETARY_COLUMNS = ['Expenditure', 'Income', 'Balance']
 
 def clean_text(text):
     """Clean and normalize text content"""
-    if not text:
-        return ""
-    # Remove HTML entities and extra whitespace
-    text = re.sub(r'&[^;]+;', '', text)
-    text = re.sub(r'\s+', ' ', text).strip()
-    return text
+    # lxml already decodes HTML entities, so only collapse whitespace
+    return ' '.join(text.split()) if text else ""
 
-def extract_monetary_value(text):
-    """Extract monetary values from text like '€630.25m' or '€-562.39m'"""
-    if not text:
-        return ""
-    # Remove HTML and get clean text
-    text = clean_text(text)
-    # Extract the monetary value (with sign if present)
-    match = re.search(r'€([-+]?[\d,]+\.?\d*[km]?)', text)
-    if match:
-        return match.group(1)
-    return ""
+def extract_monetary_values(df):
+    """Extract monetary values (with sign if present) from the money columns in place"""
+    for column in MONETARY_COLUMNS:
+        df[column] = df[column].str.extract(MONETARY_PATTERN, expand=False).fillna("")
+    return df
 
 def extract_club_name(td):
     """Extract club name from the club cell"""
-    # Find the link with the club name
-    link = td.find('a', title=True)
-    if link and link.get('title'):
-        return clean_text(link.get('title'))
+    # Title of the first link carrying one
+    titles = td.xpath('(.//a[@title])[1]/@title')
+    if titles and titles[0]:
+        return clean_text(titles[0])
     return ""
 
 def extract_competition(td):
     """Extract competition name from the competition cell"""
-    # Find the link with competition name
-    link = td.find('a')
-    if link:
-        return clean_text(link.get_text())
+    # Text of the first link
+    links = td.xpath('(.//a)[1]')
+    if links:
+        return clean_text(links[0].text_content())
     return ""
 
 def extract_table_data(html_content):
     """Extract table data from HTML content"""
-    soup = BeautifulSoup(html_content, 'html.parser')
-    
-    # Find the table
-    table = soup.find('table', class_='items')
-    if not table:
+    if not html_content or not html_content.strip():
         return []
+    doc = lxml.html.fromstring(html_content)
     
-    rows = []
-    tbody = table.find('tbody')
-    if tbody:
-        for tr in tbody.find_all('tr'):
-            tds = tr.find_all('td')
-            if len(tds) >= 9:  # Ensure we have enough columns
-                row = {}
-                
-                # Rank
-                row['Rank'] = clean_text(tds[0].get_text())
-                
-                # Club name (from the 3rd td which contains the club link)
-                row['Club'] = extract_club_name(tds[2])
-                
-                # Competition
-                row['Competition'] = extract_competition(tds[3])
-                
-                # Expenditure
-                row['Expenditure'] = extract_monetary_value(tds[4].get_text())
-                
-                # Arrivals
-                row['Arrivals'] = clean_text(tds[5].get_text())
-                
-                # Income
-                row['Income'] = extract_monetary_value(tds[6].get_text())
-                
-                # Departures
-                row['Departures'] = clean_text(tds[7].get_text())
-                
-                # Balance
-                row['Balance'] = extract_monetary_value(tds[8].get_text())
-                
-                rows.append(row)
+    # Rows of the first table with class "items" (first tbody, nested rows included)
+    trs = doc.xpath("(//table[contains(concat(' ', normalize-space(@class), ' '), ' items ')])[1]"
+                    "/descendant::tbody[1]//tr")
     
+    rows = []
+    for tr in trs:
+        tds = tr.xpath('.//td')
+        if len(tds) >= 9:  # Ensure we have enough columns
+            rows.append((
+                clean_text(tds[0].text_content()),  # Rank
+                extract_club_name(tds[2]),  # Club name (3rd td holds the club link)
+                extract_competition(tds[3]),  # Competition
+                clean_text(tds[4].text_content()),  # Expenditure (extracted later)
+                clean_text(tds[5].text_content()),  # Arrivals
+                clean_text(tds[6].text_content()),  # Income (extracted later)
+                clean_text(tds[7].text_content()),  # Departures
+                clean_text(tds[8].text_content()),  # Balance (extracted later)
+            ))
+
     return rows
 
+def process_one(file_path):
+    """Read one HTML file and extract its table rows"""
+    html_file = os.path.basename(file_path)
+    print(f"Processing {html_file}...")
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            html_content = f.read()
+        
+        # Extract data from this file
+        return extract_table_data(html_content)
+        
+    except Exception as e:
+        print(f"Error processing {html_file}: {e}")
+        return []
+
 def main():
     # Directory containing HTML files
     html_dir = '/Users/eugine_kang/Documents/hobby/Unnecessary Analysis/transfer_spending'
@@ -94,34 +93,24 @@ def main():
     html_files = [f for f in os.listdir(html_dir) if f.endswith('.html')]
     html_files.sort()  # Sort to ensure consistent order
     
-    all_data = []
+    paths = [os.path.join(html_dir, f) for f in html_files]
     
-    # Process each HTML file
-    for html_file in html_files:
-        print(f"Processing {html_file}...")
-        file_path = os.path.join(html_dir, html_file)
-        
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                html_content = f.read()
-            
-            # Extract data from this file
-            data = extract_table_data(html_content)
-            all_data.extend(data)
-            
-        except Exception as e:
-            print(f"Error processing {html_file}: {e}")
+    # Process the HTML files concurrently; map keeps the sorted file order
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        results = list(executor.map(process_one, paths))
+    all_data = list(itertools.chain.from_iterable(results))
     
     # Write to CSV
     if all_data:
         csv_file = os.path.join(html_dir, 'transfer_spending_data.csv')
         
-        fieldnames = ['Rank', 'Club', 'Competition', 'Expenditure', 'Arrivals', 'Income', 'Departures', 'Balance']
+        # Pull the monetary values out of all rows in one pass per column
+        df = extract_monetary_values(pd.DataFrame.from_records(all_data, columns=FIELDNAMES))
         
-        with open(csv_file, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(all_data)
+        with open(csv_file, 'w', newline='', encoding='utf-8', buffering=1024 * 1024) as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(FIELDNAMES)
+            writer.writerows(df.itertuples(index=False, name=None))
         
         print(f"Successfully extracted {len(all_data)} rows to {csv_file}")
     else:
@@ -5,26 +5,7 @@ Script to filter winners_cleaned.csv to remove seasons before 2000-01.
 
 import pandas as pd
 import os
-import re
-
-
-def season_to_year(season):
-    """Convert season format to starting year for comparison."""
-    if pd.isna(season) or season == '':
-        return None
-    
-    # Handle YY/YY format
-    match = re.match(r'^(\d{2})/(\d{2})$', season)
-    if match:
-        year1 = int(match.group(1))
-        # Convert 2-digit year to 4-digit year
-        # 00-25 -> 2000-2025, 26-99 -> 1926-1999
-        if year1 <= 25:
-            return 2000 + year1
-        else:
-            return 1900 + year1
-    
-    return None
+from seasons import seasons_to_years
 
 
 def main():
@@ -45,7 +26,7 @@ def main():
     print(df[['League', 'Winning Season', 'Next Season', 'Club']].head(10))
     
     # Convert seasons to years for filtering
-    df['season_year'] = df['Winning Season'].apply(season_to_year)
+    df['season_year'] = seasons_to_years(df['Winning Season'])
     
     # Filter to keep seasons from 2000-01 onwards (starting year >= 2000)
     print(f"\nFiltering to keep seasons from 2000-01 onwards...")
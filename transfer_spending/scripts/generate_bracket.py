@@ -1,6 +1,27 @@
+import re
+from collections import namedtuple
+
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
 
+# "1. Paris Saint-Germain 23/24 (€454m)" -> "Paris Saint-Germain"
+TEAM_PATTERN = re.compile(r'^\d+\.\s*(.*?)\s*\d{2}/\d{2}.*$')
+
+# Bracket entry: box label, club name and fill color
+Team = namedtuple('Team', ['label', 'short_name', 'color'])
+
+# Team colors from the original plot (Ligue 1 = purple, Premier League = blue, LaLiga = red, Serie A = green)
+team_colors = {
+    "Paris Saint-Germain": "#9966CC",  # Purple (Ligue 1)
+    "Liverpool FC": "#4169E1",         # Blue (Premier League)
+    "FC Barcelona": "#DC143C",         # Red (LaLiga)
+    "Juventus FC": "#32CD32",          # Green (Serie A)
+    "Chelsea FC": "#4169E1",           # Blue (Premier League)
+    "Manchester City": "#4169E1",      # Blue (Premier League)
+    "Real Madrid": "#DC143C",          # Red (LaLiga)
+    "Atlético de Madrid": "#DC143C"    # Red (LaLiga)
+}
+
 # Top 8 teams from the transfer spending plot
 teams = [
     "1. Paris Saint-Germain 23/24 (€454m)",
@@ -13,6 +34,17 @@ teams = [
     "8. Atlético de Madrid 14/15 (€144m)"
 ]
 
+
+def make_team(team):
+    """Build a Team record from a '1. Club YY/YY (€Nm)' entry."""
+    short_name = TEAM_PATTERN.match(team).group(1)
+    return Team(label=team.split('(')[0].strip(), short_name=short_name,
+                color=team_colors[short_name])
+
+
+# Resolve each team's label, name and color once, before drawing
+teams = [make_team(team) for team in teams]
+
 # Traditional bracket matchups: 1v8, 2v7, 3v6, 4v5
 matchups = [
     (teams[0], teams[7]),  # 1 vs 8
@@ -35,36 +67,20 @@ ax.text(6, 7.1, 'Top 8 Teams by Transfer Expenditure (Traditional Seeding)',
 # Quarter-finals positions
 y_positions = [5.5, 4.5, 2.5, 1.5]
 
-# Team colors from the original plot (Ligue 1 = purple, Premier League = blue, LaLiga = red, Serie A = green)
-team_colors = {
-    "Paris Saint-Germain": "#9966CC",  # Purple (Ligue 1)
-    "Liverpool FC": "#4169E1",         # Blue (Premier League)
-    "FC Barcelona": "#DC143C",         # Red (LaLiga)
-    "Juventus FC": "#32CD32",          # Green (Serie A)
-    "Chelsea FC": "#4169E1",           # Blue (Premier League)
-    "Manchester City": "#4169E1",      # Blue (Premier League)
-    "Real Madrid": "#DC143C",          # Red (LaLiga)
-    "Atlético de Madrid": "#DC143C"    # Red (LaLiga)
-}
-
 # Draw quarter-final matchups
 for i, ((team1, team2), y_pos) in enumerate(zip(matchups, y_positions)):
-    # Extract team names for color lookup
-    team1_name = team1.split(' 23/24')[0].split(' 25/26')[0].split(' 19/20')[0].split(' 18/19')[0].split(' 17/18')[0].split(' 14/15')[0].replace('1. ', '').replace('2. ', '').replace('3. ', '').replace('4. ', '').replace('5. ', '').replace('6. ', '').replace('7. ', '').replace('8. ', '')
-    team2_name = team2.split(' 23/24')[0].split(' 25/26')[0].split(' 19/20')[0].split(' 18/19')[0].split(' 17/18')[0].split(' 14/15')[0].replace('1. ', '').replace('2. ', '').replace('3. ', '').replace('4. ', '').replace('5. ', '').replace('6. ', '').replace('7. ', '').replace('8. ', '')
-    
     # Team 1
     rect1 = patches.Rectangle((0.5, y_pos), 3, 0.3, 
-                             linewidth=1, edgecolor='black', facecolor=team_colors[team1_name])
+                             linewidth=1, edgecolor='black', facecolor=team1.color)
     ax.add_patch(rect1)
-    ax.text(2, y_pos + 0.15, team1.split('(')[0].strip(), 
+    ax.text(2, y_pos + 0.15, team1.label, 
             fontsize=9, ha='center', va='center', fontweight='bold', color='white')
     
     # Team 2
     rect2 = patches.Rectangle((0.5, y_pos - 0.4), 3, 0.3, 
-                             linewidth=1, edgecolor='black', facecolor=team_colors[team2_name])
+                             linewidth=1, edgecolor='black', facecolor=team2.color)
     ax.add_patch(rect2)
-    ax.text(2, y_pos - 0.25, team2.split('(')[0].strip(), 
+    ax.text(2, y_pos - 0.25, team2.label, 
             fontsize=9, ha='center', va='center', fontweight='bold', color='white')
     
     # Connecting line
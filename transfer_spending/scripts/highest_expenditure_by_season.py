@@ -5,14 +5,16 @@ import numpy as np
 # Load the data
 df = pd.read_csv('/Users/eugine_kang/Documents/hobby/Unnecessary Analysis/transfer_spending/data/transfer_spending_cleaned.csv')
 
-# Convert expenditure to numeric (remove 'm' and convert to float)
-df['Expenditure_numeric'] = df['Expenditure'].str.replace('m', '').astype(float)
+# Convert expenditure to numeric (strip the trailing 'm' and convert to float32)
+df['Expenditure_numeric'] = df['Expenditure'].str.removesuffix('m').astype('float32')
 
-# Find the highest expenditure team for each season
-highest_per_season = df.loc[df.groupby('Season')['Expenditure_numeric'].idxmax()]
-
-# Sort by season for proper ordering
-highest_per_season = highest_per_season.sort_values('Season')
+# Find the highest expenditure team for each season, already ordered by season
+# (stable sort keeps the first of tied clubs and rows without a season are
+# dropped, as the groupby idxmax did)
+highest_per_season = (df.dropna(subset=['Season'])
+                        .sort_values(['Season', 'Expenditure_numeric'], ascending=[True, False], kind='stable')
+                        .drop_duplicates('Season', keep='first')
+                        .reset_index(drop=True))
 
 # Define seasons to highlight
 highlight_seasons = ['09/10', '17/18', '22/23', '25/26']
@@ -5,6 +5,7 @@ Script to join transfer_spending_cleaned.csv and winners_cleaned.csv datasets.
 
 import pandas as pd
 import os
+from seasons import seasons_to_years
 
 
 def main():
@@ -39,28 +40,8 @@ def main():
     # Filter out rows with empty Next Season (these are the most recent seasons)
     winners_join = winners_join[winners_join['Next Season'] != '']
     
-    # Filter to keep only seasons from 2000-01 onwards
-    def season_to_year(season):
-        """Convert season format to starting year for comparison."""
-        if pd.isna(season) or season == '':
-            return None
-        
-        # Handle YY/YY format
-        import re
-        match = re.match(r'^(\d{2})/(\d{2})$', season)
-        if match:
-            year1 = int(match.group(1))
-            # Convert 2-digit year to 4-digit year
-            # 00-25 -> 2000-2025, 26-99 -> 1926-1999
-            if year1 <= 25:
-                return 2000 + year1
-            else:
-                return 1900 + year1
-        
-        return None
-    
     # Filter to keep seasons from 2000-01 onwards (starting year >= 2000)
-    winners_join['season_year'] = winners_join['Winning Season'].apply(season_to_year)
+    winners_join['season_year'] = seasons_to_years(winners_join['Winning Season'])
     winners_join = winners_join[winners_join['season_year'] >= 2000]
     winners_join = winners_join.drop('season_year', axis=1)
     
@@ -103,7 +84,7 @@ def main():
     champions_data = winners_df[winners_df['League'] == 'Champions League'][['Next Season', 'Club']].copy()
     
     # Filter to 2000+ seasons using the same logic
-    champions_data['season_year'] = champions_data['Next Season'].apply(lambda x: season_to_year(x) if pd.notna(x) and x != '' else None)
+    champions_data['season_year'] = seasons_to_years(champions_data['Next Season'])
     champions_data = champions_data[champions_data['season_year'] >= 2000]
     champions_data = champions_data.drop('season_year', axis=1)
     
@@ -5,8 +5,8 @@ import numpy as np
 # Read the data
 df = pd.read_csv('/Users/eugine_kang/Documents/hobby/Unnecessary Analysis/transfer_spending/data/liverpool_spending.csv')
 
-# Convert expenditure to numeric (remove 'm' and convert to float)
-df['Expenditure_numeric'] = df['Expenditure'].str.replace('m', '').astype(float)
+# Convert expenditure to numeric (strip the trailing 'm' and convert to float32)
+df['Expenditure_numeric'] = df['Expenditure'].str.removesuffix('m').astype('float32')
 
 # Sort by expenditure in descending order (highest on top)
 df_sorted = df.sort_values('Expenditure_numeric', ascending=True)
@@ -0,0 +1,18 @@
+#!/usr/bin/env python3
+"""
+Shared season helpers for the winners scripts.
+"""
+
+import re
+import numpy as np
+
+# "YY/YY" season code
+SEASON_PATTERN = re.compile(r'^(\d{2})/\d{2}$')
+
+
+def seasons_to_years(seasons):
+    """Convert a Series of YY/YY seasons to starting years (NaN if unparseable)."""
+    yy = seasons.str.extract(SEASON_PATTERN, expand=False).astype(float)
+    # Convert 2-digit year to 4-digit year
+    # 00-25 -> 2000-2025, 26-99 -> 1926-1999
+    return yy + np.where(yy <= 25, 2000, 1900)
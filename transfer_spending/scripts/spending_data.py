@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Shared loader for transfer_spending_cleaned.csv used by the plotting scripts.
+"""
+
+import os
+import numpy as np
+import pandas as pd
+
+CLEANED_CSV = '/Users/eugine_kang/Documents/hobby/Unnecessary Analysis/transfer_spending/data/transfer_spending_cleaned.csv'
+
+# Columns the plotting scripts use, text columns typed up front
+SPENDING_COLUMNS = ['Rank', 'Club', 'League', 'Season', 'Expenditure']
+SPENDING_DTYPES = {'Club': str, 'League': str, 'Season': str, 'Expenditure': str}
+
+
+def load_transfer_spending(path=CLEANED_CSV):
+    """
+    Load the cleaned transfer spending data with Expenditure parsed to float32 millions.
+    
+    The parsed frame is pickled next to the CSV and reused while it is newer
+    than both the CSV and this module, so back-to-back script runs parse the
+    file only once and edits to the parsing below invalidate the cache.
+    
+    Args:
+        path (str): Path to transfer_spending_cleaned.csv
+        
+    Returns:
+        pd.DataFrame: Rank, Club, League, Season and numeric Expenditure columns
+    """
+    cache_path = path + '.pkl'
+    source_mtime = max(os.path.getmtime(path), os.path.getmtime(__file__))
+    if os.path.exists(cache_path) and os.path.getmtime(cache_path) >= source_mtime:
+        return pd.read_pickle(cache_path)
+    
+    df = pd.read_csv(path, usecols=SPENDING_COLUMNS, dtype=SPENDING_DTYPES)
+    
+    # Convert Expenditure to numeric, removing 'm'/'€'/',' and handling any non-numeric values
+    df['Expenditure'] = pd.to_numeric(
+        df['Expenditure'].astype(str).str.replace(r'[m€,]', '', regex=True), errors='coerce'
+    ).fillna(0).astype(np.float32)
+    
+    df.to_pickle(cache_path)
+    return df
@@ -2,11 +2,12 @@
 import pytest
 import sys
 import os
+import pandas as pd
 
 # Add the current directory to the Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from clean_csv import split_competition
+from clean_csv import split_competition, split_competition_column
 
 class TestSplitCompetition:
     """Test cases for the split_competition function."""
@@ -108,6 +109,32 @@ class TestSplitCompetition:
         result = split_competition(competition)
         assert result == (expected_league, expected_season)
 
+class TestSplitCompetitionColumn:
+    """Test cases for the vectorized split_competition_column function."""
+    
+    def test_matches_scalar_split(self):
+        """Test that the column split agrees with split_competition row by row."""
+        competitions = pd.Series([
+            "Premier League 22/23",
+            "  Premier League   22/23  ",
+            "Premier League",
+            "Premier League 2022/23",
+            "Premier League 22/23 Extra",
+            "",
+            None,
+            123,
+        ])
+        result = split_competition_column(competitions)
+        expected = [split_competition(c) for c in competitions]
+        assert list(zip(result['League'], result['Season'])) == expected
+        
+    def test_preserves_index(self):
+        """Test that the result is aligned with the input index."""
+        competitions = pd.Series(["LaLiga 17/18", "Serie A 19/20"], index=[5, 9])
+        result = split_competition_column(competitions)
+        assert list(result.index) == [5, 9]
+        assert list(result.columns) == ['League', 'Season']
+
 if __name__ == "__main__":
     # Run the tests
     pytest.main([__file__, "-v"])
\ No newline at end of file